@@ -1,5 +1,5 @@
 from datetime import datetime, timedelta
-import random
+import numpy as np
 
 from PySide6.QtGui import QBrush, QPen
 from PySide6.QtWidgets import QMainWindow
@@ -8,6 +8,9 @@ from sprintify.navigation.colors.modes import ColorMap
 from sprintify.navigation.rulers import NumberRuler, TimelineRuler
 from sprintify.navigation.navigation_widget import NavigationWidget
 
+# Shared generator; shapes are drawn in batched array calls instead of per-value random.* calls
+_rng = np.random.default_rng()
+
 class NavigationWindow(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -34,36 +37,38 @@ class NavigationWindow(QMainWindow):
     def get_random_rects(self):
         if self.rects:
             return self.rects
-        rects = []
-        for _ in range(20000):
-            x = self.random_datetime()
-            y = random.uniform(0, 50000)
-            width = self.random_timedelta()
-            height = random.uniform(100, 500)
-            rects.append((x, y, width, height))
+        count = 20000
+        rects = list(zip(
+            self.random_datetimes(count),
+            _rng.uniform(0, 50000, count).tolist(),
+            self.random_timedeltas(count),
+            _rng.uniform(100, 500, count).tolist(),
+        ))
         self.rects = rects
         return rects
 
     def get_random_lines(self):
         if self.lines:
             return self.lines
-        lines = []
-        for _ in range(8000):
-            x1 = self.random_datetime()
-            y1 = random.uniform(0, 50000)
-            x2 = self.random_datetime()
-            y2 = random.uniform(0, 50000)
-            lines.append((x1, y1, x2, y2))
+        count = 8000
+        lines = list(zip(
+            self.random_datetimes(count),
+            _rng.uniform(0, 50000, count).tolist(),
+            self.random_datetimes(count),
+            _rng.uniform(0, 50000, count).tolist(),
+        ))
         self.lines = lines
         return lines
 
-    def random_datetime(self):
+    def random_datetimes(self, count):
         start = datetime(2023, 4, 1)
         end = datetime(2024, 5, 1)
-        return start + timedelta(seconds=random.randint(0, int((end - start).total_seconds())))
+        seconds = _rng.integers(0, int((end - start).total_seconds()), count, endpoint=True)
+        return [start + timedelta(seconds=s) for s in seconds.tolist()]
 
-    def random_timedelta(self):
-        return timedelta(seconds=random.randint(0, 3600 * 24 * 7))  # Up to 7 days
+    def random_timedeltas(self, count):
+        seconds = _rng.integers(0, 3600 * 24 * 7, count, endpoint=True)  # Up to 7 days
+        return [timedelta(seconds=s) for s in seconds.tolist()]
 
 if __name__ == "__main__":
     import sys
@@ -7,15 +7,15 @@ Optimized for large datasets (1000+ products) with:
 - Direct drawing for large grids (no individual items)
 - Interactive items only for smaller grids (with tooltips only, no selection/drag)
 """
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-import random
 import math
 from dataclasses import dataclass
 import numpy as np
 
-from PySide6.QtGui import QBrush, QPen, QColor, QFont, QPainter
-from PySide6.QtWidgets import QMainWindow, QProgressDialog, QToolTip
-from PySide6.QtCore import Qt, QRectF, QEvent
+from PySide6.QtGui import QBrush, QPen, QColor, QFont, QImage, QPainter, QPixmap, QStaticText, QTransform
+from PySide6.QtWidgets import QMainWindow, QMessageBox, QProgressDialog, QToolTip
+from PySide6.QtCore import Qt, QPointF, QRectF, QLineF, QEvent, QTimer
 
 from sprintify.navigation.colors.modes import ColorMap
 from sprintify.navigation.rulers import ItemRuler
@@ -23,6 +23,40 @@ from sprintify.navigation.navigation_widget import NavigationWidget
 from sprintify.navigation.interaction.interaction_item import InteractiveItem
 from sprintify.navigation.interaction.selection import InteractionHandler
 
+# Number of entries in the correlation -> color lookup table
+COLOR_LUT_SIZE = 512
+
+# Cells narrower/shorter than this (pixels) are filled with a single scaled image blit
+IMAGE_BLIT_CELL_PX = 8
+
+# Interactive grids keep items for this many cells beyond each viewport edge
+ITEM_MARGIN_CELLS = 2
+
+# Cursor rest time before the direct drawing mode shows a cell tooltip
+TOOLTIP_DELAY_MS = 50
+
+# Shared generator for synthetic sales data (batched draws instead of per-value calls)
+_rng = np.random.default_rng()
+
+
+def correlation_colors(correlations) -> np.ndarray:
+    """Blue (-1) -> white (0) -> red (+1) gradient for an array of correlations, as (..., 3) uint8 RGB."""
+    normalized = (np.asarray(correlations, dtype=np.float64) + 1.0) / 2.0
+    lower = normalized < 0.5
+    t_low = normalized * 2
+    t_high = (normalized - 0.5) * 2
+
+    rgb = np.empty(normalized.shape + (3,), dtype=np.uint8)
+    rgb[..., 0] = np.where(lower, 255 * t_low, 255)
+    rgb[..., 1] = np.where(lower, 255 * t_low, 255 * (1 - t_high))
+    rgb[..., 2] = np.where(lower, 255, 255 * (1 - t_high))
+    return rgb
+
+
+def correlation_palette(size: int) -> np.ndarray:
+    """Gradient sampled at size evenly spaced correlations in [-1, 1], as a (size, 3) uint8 RGB table."""
+    return correlation_colors(np.linspace(-1.0, 1.0, size))
+
 
 class Article:
     """Represents an article/product with sales data."""
@@ -31,69 +65,113 @@ class Article:
         self.id = article_id
         self.name = name
         self.category = category
-        self.sales_pattern = None  # Will be numpy array
+        self.sales_pattern = None  # Will be numpy array (often a row view of a shared pattern matrix)
 
-    def generate_sales_pattern_fast(self, days=365):
-        """Generate sales pattern using vectorized operations."""
-        # Base pattern with seasonality
-        base_level = random.uniform(50, 200)
-        seasonality_amplitude = random.uniform(20, 80)
-        trend = random.uniform(-0.5, 0.5)
-        noise_level = random.uniform(5, 20)
 
-        # Vectorized calculation
-        day_array = np.arange(days)
-        seasonal = seasonality_amplitude * np.sin(2 * np.pi * day_array / 365)
-        trend_component = trend * day_array
-        noise = np.random.uniform(-noise_level, noise_level, days)
-        weekly = np.where(day_array % 7 >= 5, -10, 0)
+def generate_sales_patterns(out: np.ndarray) -> np.ndarray:
+    """Fill every row of an (articles x days) matrix with an independent seasonal sales pattern."""
+    count, days = out.shape
 
-        sales = base_level + seasonal + trend_component + weekly + noise
-        self.sales_pattern = np.maximum(0, sales)
+    # Per-row base level, seasonality amplitude, trend and noise level, each shaped (count, 1)
+    base_level, seasonality_amplitude, trend, noise_level = _rng.uniform(
+        (50, 20, -0.5, 5), (200, 80, 0.5, 20), (count, 4)
+    ).T[:, :, np.newaxis]
 
+    # Vectorized calculation over the whole block, accumulated in place
+    day_array = np.arange(days, dtype=np.float64)
+    np.multiply(seasonality_amplitude, np.sin(day_array * (2 * np.pi / 365)), out=out)
+    out += base_level
+    out += trend * day_array
+    out += _rng.uniform(-noise_level, noise_level, (count, days))
 
-def calculate_correlation_matrix_fast(articles):
-    """Calculate correlation matrix using NumPy for speed."""
-    n = len(articles)
+    # Weekend dip (days 5 and 6 of each week)
+    out[:, 5::7] -= 10
+    out[:, 6::7] -= 10
 
-    # Stack all sales patterns into a matrix
-    sales_matrix = np.array([a.sales_pattern for a in articles])
+    np.maximum(out, 0.0, out=out)
+    return out
 
-    # Calculate correlation matrix using NumPy
-    # Transpose so each column is an article
-    sales_T = sales_matrix.T
 
-    # Standardize each column (article)
-    means = np.mean(sales_T, axis=0)
-    stds = np.std(sales_T, axis=0)
+def stack_sales_patterns(articles) -> np.ndarray:
+    """
+    Stack the articles' sales patterns into one (articles x days) float32 matrix.
 
-    # Avoid division by zero
-    stds[stds == 0] = 1
+    Callers that generated the patterns into a shared matrix should pass that matrix
+    instead (CorrelationHeatmapWindow's patterns= argument) to skip this copy.
+    """
+    if not articles:
+        return np.empty((0, 0), dtype=np.float32)
+    return np.stack([article.sales_pattern for article in articles]).astype(np.float32, copy=False)
 
-    standardized = (sales_T - means) / stds
 
-    # Calculate correlation matrix
-    correlation_matrix = np.dot(standardized.T, standardized) / (sales_T.shape[0] - 1)
+def calculate_correlation_matrix_fast(patterns):
+    """Calculate the correlation matrix of an (articles x days) sales matrix using NumPy for speed."""
+    # float32 is ample for correlations shown to 2-3 decimals and halves the memory the
+    # BLAS product streams; a float32 matrix is used as-is, without a copy
+    patterns = np.asarray(patterns, dtype=np.float32)
+
+    # np.corrcoef forms X @ X.T on the centered data, which NumPy routes to BLAS syrk: only one
+    # triangle is computed and mirrored, so there is no need to call ssyrk by hand.
+    # Constant patterns have zero variance; their undefined correlations become 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        correlation_matrix = np.corrcoef(patterns, dtype=np.float32)
+    np.nan_to_num(correlation_matrix, copy=False, nan=0.0)
 
     # Ensure diagonal is exactly 1 and clamp to [-1, 1]
     np.fill_diagonal(correlation_matrix, 1.0)
-    correlation_matrix = np.clip(correlation_matrix, -1, 1)
+    np.clip(correlation_matrix, -1.0, 1.0, out=correlation_matrix)
 
     return correlation_matrix
 
 
-def create_correlated_articles_fast(base_pattern, correlation_strength, article_id, name, category="Mixed"):
-    """Create article with correlated pattern using vectorized operations."""
-    new_article = Article(article_id, name, category)
-
-    noise_factor = math.sqrt(max(0, 1 - correlation_strength ** 2))
-
-    # Generate correlated pattern using vectorized operations
-    independent_pattern = np.random.uniform(0, 200, len(base_pattern))
-    correlated_pattern = correlation_strength * base_pattern + noise_factor * independent_pattern
-    new_article.sales_pattern = np.maximum(0, correlated_pattern)
-
-    return new_article
+def correlated_patterns(base_patterns, correlation_strengths, out=None) -> np.ndarray:
+    """
+    Blend base patterns with uniform noise to get one pattern per correlation strength.
+
+    base_patterns is either one (days,) pattern shared by all rows or an (articles x days)
+    matrix with one base row per strength. All noise comes from a single draw.
+    """
+    base_patterns = np.asarray(base_patterns)
+    strengths = np.asarray(correlation_strengths, dtype=np.float64)
+    noise_factors = np.sqrt(np.maximum(0.0, 1.0 - strengths ** 2))
+
+    # One (articles x days) noise draw, blended with the base patterns row by row
+    shape = (strengths.size, base_patterns.shape[-1])
+    patterns = np.empty(shape, dtype=np.float64) if out is None else out
+    np.multiply(_rng.uniform(0, 200, shape), noise_factors[:, None], out=patterns)
+    patterns += strengths[:, None] * base_patterns
+    np.maximum(patterns, 0.0, out=patterns)
+    return patterns
+
+
+def correlation_pyramid(codes: np.ndarray, min_size: int = 64) -> list:
+    """2x2 block-mean levels of an int8 correlation matrix, halving until a side is <= min_size."""
+    levels = [codes]
+    while min(levels[-1].shape) > min_size:
+        m = levels[-1].astype(np.int16)
+        m = np.pad(m, ((0, m.shape[0] % 2), (0, m.shape[1] % 2)), mode="edge")
+        m = (m[0::2, 0::2] + m[1::2, 0::2] + m[0::2, 1::2] + m[1::2, 1::2]) // 4
+        levels.append(m.astype(np.int8))
+    return levels
+
+
+def heatmap_cell_geometry(col_edges: np.ndarray, row_edges: np.ndarray, buckets: np.ndarray):
+    """
+    Flatten a block of heatmap cells into rectangle arrays grouped by color bucket.
+
+    Returns (xs, ys, ws, hs, bucket_ids, starts): cell rectangles sorted by bucket, the
+    distinct bucket ids, and the offset of each bucket's first cell followed by the total count.
+    """
+    order = np.argsort(buckets, axis=None, kind="stable")
+    rows, cols = np.divmod(order, col_edges.size - 1)
+    xs = col_edges[cols]
+    ws = col_edges[cols + 1] - xs
+    ys = row_edges[rows]
+    hs = row_edges[rows + 1] - ys
+
+    sorted_buckets = buckets.ravel()[order]
+    starts = np.concatenate(([0], np.flatnonzero(np.diff(sorted_buckets)) + 1, [sorted_buckets.size]))
+    return xs, ys, ws, hs, sorted_buckets[starts[:-1]], starts
 
 
 @dataclass
@@ -104,30 +182,55 @@ class HeatmapCell:
     row_article: Article
     col_article: Article
     correlation: float
+    color_index: int  # Index into the window's color/brush lookup tables
 
 
 class CorrelationHeatmapWindow(QMainWindow):
-    def __init__(self, articles=None):
+    def __init__(self, articles=None, patterns=None):
         super().__init__()
         self.articles = articles or []
+
+        # (articles x days) sales matrix; pass the shared matrix the patterns were generated
+        # into to skip re-stacking one array per article
+        self.patterns = stack_sales_patterns(self.articles) if patterns is None else patterns
         self.setWindowTitle("Article Correlation Heatmap")
         self.setMinimumSize(1000, 800)
 
         self.color_map = ColorMap(darkmode=True)
 
-        # Show progress dialog for large datasets
-        progress = None
-        if len(self.articles) > 100:
-            progress = QProgressDialog("Calculating correlations...", None, 0, 100, self)
-            progress.setWindowModality(Qt.WindowModality.WindowModal)
-            progress.show()
-            progress.setValue(10)
+        # Correlation -> color lookup table, built once instead of per cell. The uint8 RGB table
+        # serves vectorized gathers; the QColor/QBrush lists serve per-bucket painter state.
+        self._rgb_lut = correlation_palette(COLOR_LUT_SIZE)
+        self._color_lut = [QColor(r, g, b) for r, g, b in self._rgb_lut.tolist()]
+        self._brush_lut = [QBrush(color) for color in self._color_lut]
+
+        # int8 correlation code (round(correlation * 127)) -> color LUT index, indexed by the
+        # code's uint8 bit pattern so the paint path needs no arithmetic (-128 never occurs)
+        codes = np.arange(256, dtype=np.uint8).view(np.int8)
+        self._code_color_index = self._color_indices(np.maximum(codes, -127) / 127.0)
+
+        # Cell labels show 2 decimals, so only 201 distinct strings exist (-1.00 .. 1.00)
+        self._text_lut = [f"{v / 100:.2f}" for v in range(-100, 101)]
+
+        # Painter state shared by all cells of the direct drawing path
+        self._border_color = self.color_map.get_object_color("border")
+        self._border_pen = QPen(self._border_color, 0.5)
 
-        # Pre-calculate correlation matrix using fast vectorized method
-        self.correlation_matrix = calculate_correlation_matrix_fast(self.articles)
+        # Label fonts (7pt up to 60px wide cells, 8pt above) and text pens, built once
+        self._label_font_small = QFont()
+        self._label_font_small.setPointSize(7)
+        self._label_font_large = QFont()
+        self._label_font_large.setPointSize(8)
+        self._dark_text_pen = QPen(Qt.GlobalColor.black)
+        self._light_text_pen = QPen(Qt.GlobalColor.white)
 
-        if progress:
-            progress.setValue(90)
+        # Pre-laid-out labels per font, indexed like _text_lut
+        self._static_labels_small = self._build_static_labels(self._label_font_small)
+        self._static_labels_large = self._build_static_labels(self._label_font_large)
+
+        # Rendered heatmap, reused while the visible range and viewport size are unchanged
+        self._heatmap_cache: QPixmap | None = None
+        self._heatmap_cache_key = None
 
         # Create ItemRulers for both axes
         self.h_ruler = ItemRuler(
@@ -156,13 +259,87 @@ class CorrelationHeatmapWindow(QMainWindow):
         # For large grids, use direct drawing instead of interactive items
         self.use_direct_drawing = len(self.articles) > 50
 
+        # Cell under the mouse at the last tooltip update (direct drawing mode); the tooltip for
+        # a new cell is shown once the cursor has rested for TOOLTIP_DELAY_MS
+        self._last_hover_cell = None
+        self._tooltip_pos = None
+        self._tooltip_timer = QTimer(self)
+        self._tooltip_timer.setSingleShot(True)
+        self._tooltip_timer.setInterval(TOOLTIP_DELAY_MS)
+        self._tooltip_timer.timeout.connect(self._show_hover_tooltip)
+
+        # Show a busy progress dialog for large datasets
+        self.correlation_matrix = None
+        self.correlation_matrix_q = None
+        self._progress = None
+        if len(self.articles) > 100:
+            self._progress = QProgressDialog("Calculating correlations...", None, 0, 0, self)
+            self._progress.setWindowModality(Qt.WindowModality.WindowModal)
+            self._progress.show()
+
+        # Calculate the correlation matrix on a worker thread (BLAS releases the GIL, so the
+        # event loop and progress dialog stay live) and poll for the result
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._correlation_future = self._executor.submit(calculate_correlation_matrix_fast, self.patterns)
+        self._correlation_poll = QTimer(self)
+        self._correlation_poll.setInterval(20)
+        self._correlation_poll.timeout.connect(self._poll_correlations)
+        self._correlation_poll.start()
+
+    def _poll_correlations(self):
+        """Install the correlation matrix once the worker has finished."""
+        if not self._correlation_future.done():
+            return
+        self._correlation_poll.stop()
+        self._executor.shutdown(wait=False)
+        try:
+            correlation_matrix = self._correlation_future.result()
+        except Exception as e:
+            # Don't let worker errors (e.g. MemoryError for large N) escape into the
+            # event loop with the modal progress dialog still open
+            if self._progress:
+                self._progress.close()
+                self._progress = None
+            QMessageBox.critical(self, "Correlation Error", str(e) or type(e).__name__)
+            return
+        self._set_correlation_matrix(correlation_matrix)
+
+    def closeEvent(self, event):
+        # Stop polling and release the worker if the window closes before it finishes;
+        # a calculation already running is left to complete in the background
+        self._correlation_poll.stop()
+        self._correlation_future.cancel()
+        self._executor.shutdown(wait=False)
+        super().closeEvent(event)
+
+    def _set_correlation_matrix(self, correlation_matrix: np.ndarray):
+        """Store the correlation matrix and set up the drawing mode that displays it."""
+        # Paints slice row blocks and tooltips read single cells, so pin the matrix to
+        # C-contiguous float32 (no copy if already so)
+        self.correlation_matrix = np.ascontiguousarray(correlation_matrix, dtype=np.float32)
+
+        # int8-quantized copy for color lookup: a quarter of the float32 bytes per painted block.
+        # The float matrix stays the source for labels and tooltips.
+        self.correlation_matrix_q = np.round(self.correlation_matrix * 127).astype(np.int8)
+
         if self.use_direct_drawing:
+            # Coarser levels for zoom levels where cells are smaller than a pixel
+            self._correlation_levels = correlation_pyramid(self.correlation_matrix_q)
+
             # Register direct drawing command for the heatmap
             self.widget.canvas.add_draw_command("heatmap", self._draw_heatmap_direct)
             # Still enable mouse tracking for tooltips
             self.widget.canvas.viewport().setMouseTracking(True)
             self.widget.canvas.viewport().installEventFilter(self)
         else:
+            # Interactive items are created lazily for the visible cells only. This command is
+            # registered before the InteractionHandler's, so it runs first on every paint.
+            self._cell_correlations = self.correlation_matrix.tolist()
+            self._cell_color_indices = self._color_indices(self.correlation_matrix).tolist()
+            self._cell_items = {}
+            self._cell_items_range = None
+            self.widget.canvas.add_draw_command("heatmap_items", self._sync_heatmap_items)
+
             # Use interactive items for smaller grids - simplified setup
             self.interaction = InteractionHandler(
                 self.widget.canvas,
@@ -175,72 +352,163 @@ class CorrelationHeatmapWindow(QMainWindow):
             self.interaction.draw_custom_item = self._draw_heatmap_cell
             self.interaction.show_tooltips = True
 
-            self._create_heatmap_items()
-
-        if progress:
-            progress.setValue(100)
-            progress.close()
-
-    def _get_color_for_correlation(self, correlation: float) -> QColor:
-        """Map correlation value [-1, 1] to a color gradient."""
-        # Map correlation to [0, 1] range
-        normalized = (correlation + 1.0) / 2.0
-
-        # Create gradient: blue (negative) -> white (zero) -> red (positive)
-        if normalized < 0.5:
-            # Blue to White
-            t = normalized * 2
-            return QColor(
-                int(0 + 255 * t),
-                int(0 + 255 * t),
-                255
-            )
-        else:
-            # White to Red
-            t = (normalized - 0.5) * 2
-            return QColor(
-                255,
-                int(255 * (1 - t)),
-                int(255 * (1 - t))
-            )
+        if self._progress:
+            self._progress.close()
+            self._progress = None
+
+    def _color_indices(self, correlations: np.ndarray) -> np.ndarray:
+        """Indices into the color lookup tables for an array of correlation values."""
+        idx = ((correlations + 1.0) * (0.5 * (COLOR_LUT_SIZE - 1))).astype(np.int16)
+        return np.clip(idx, 0, COLOR_LUT_SIZE - 1, out=idx)
 
     def _draw_heatmap_direct(self, painter: QPainter):
-        """Direct drawing method for large heatmaps."""
+        """Direct drawing method for large heatmaps (blits a cached pixmap while the view is unchanged)."""
+        viewport = self.widget.canvas.viewport()
+        dpr = viewport.devicePixelRatioF()
+        key = (
+            self.h_ruler.visible_start, self.h_ruler.visible_stop,
+            self.v_ruler.visible_start, self.v_ruler.visible_stop,
+            viewport.width(), viewport.height(), dpr,
+        )
+        if key != self._heatmap_cache_key:
+            pixmap = QPixmap(round(viewport.width() * dpr), round(viewport.height() * dpr))
+            pixmap.setDevicePixelRatio(dpr)
+            pixmap.fill(Qt.GlobalColor.transparent)
+            cache_painter = QPainter(pixmap)
+            cache_painter.setRenderHints(painter.renderHints())
+            self._render_heatmap(cache_painter)
+            cache_painter.end()
+            self._heatmap_cache = pixmap
+            self._heatmap_cache_key = key
+
+        painter.drawPixmap(0, 0, self._heatmap_cache)
+
+    def _render_heatmap(self, painter: QPainter):
+        """Draw the visible heatmap cells and labels."""
         # Get visible range
         col_start = max(0, int(self.h_ruler.visible_start))
         col_end = min(len(self.articles), int(self.h_ruler.visible_stop) + 1)
         row_start = max(0, int(self.v_ruler.visible_start))
         row_end = min(len(self.articles), int(self.v_ruler.visible_stop) + 1)
 
-        # Draw only visible cells
-        for row_idx in range(row_start, row_end):
-            for col_idx in range(col_start, col_end):
-                correlation = self.correlation_matrix[row_idx, col_idx]
-
-                # Calculate pixel rectangle
-                x1 = self.h_ruler.transform(col_idx)
-                x2 = self.h_ruler.transform(col_idx + 1)
-                y1 = self.v_ruler.transform(row_idx)
-                y2 = self.v_ruler.transform(row_idx + 1)
-                rect = QRectF(x1, y1, x2 - x1, y2 - y1)
+        # Nothing visible (panned past the grid or no articles)
+        if col_start >= col_end or row_start >= row_end:
+            return
 
-                # Draw cell
-                color = self._get_color_for_correlation(correlation)
-                painter.setBrush(QBrush(color))
-                painter.setPen(QPen(self.color_map.get_object_color("border"), 0.5))
-                painter.drawRect(rect)
+        # Pixel edges of the visible columns/rows, transformed once per paint
+        col_edges = self.h_ruler.get_item_edges(col_start, col_end)
+        row_edges = self.v_ruler.get_item_edges(row_start, row_end)
 
-                # Draw text only if cell is large enough
-                if rect.width() > 30 and rect.height() > 20:
-                    font = QFont()
-                    font.setPointSize(8 if rect.width() > 60 else 7)
-                    painter.setFont(font)
+        # Sub-pixel cells: blit a coarser pyramid level instead (grid and labels would not show)
+        cell_px = min(col_edges[1] - col_edges[0], row_edges[1] - row_edges[0])
+        if cell_px < 1.0:
+            self._fill_cells_downsampled(painter, cell_px, row_start, row_end, col_start, col_end)
+            return
 
-                    text_color = Qt.GlobalColor.black if correlation > -0.2 else Qt.GlobalColor.white
-                    painter.setPen(QPen(text_color))
+        # Visible block: color LUT indices straight from the int8 codes; floats only for labels
+        visible = self.correlation_matrix[row_start:row_end, col_start:col_end]
+        visible_q = self.correlation_matrix_q[row_start:row_end, col_start:col_end]
+        color_indices = self._code_color_index[visible_q.view(np.uint8)]
 
-                    text = f"{correlation:.2f}"
-                    painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, text)
+        # Small cells: one scaled image blit; larger cells: antialiased rects per color bucket
+        if col_edges[1] - col_edges[0] < IMAGE_BLIT_CELL_PX or row_edges[1] - row_edges[0] < IMAGE_BLIT_CELL_PX:
+            self._fill_cells_image(painter, color_indices, col_edges, row_edges)
+        else:
+            self._fill_cells_rects(painter, color_indices, col_edges, row_edges)
+
+        # Cell borders as one grid of full-length lines instead of a stroke per cell
+        col_x = col_edges.tolist()
+        row_y = row_edges.tolist()
+        left, right = col_x[0], col_x[-1]
+        top, bottom = row_y[0], row_y[-1]
+        grid = [QLineF(x, top, x, bottom) for x in col_x]
+        grid += [QLineF(left, y, right, y) for y in row_y]
+        painter.setPen(self._border_pen)
+        painter.drawLines(grid)
+
+        # Text only in cells large enough for it
+        label_cols = np.flatnonzero(np.diff(col_edges) > 30).tolist()
+        label_rows = np.flatnonzero(np.diff(row_edges) > 20).tolist()
+        if not label_cols or not label_rows:
+            return
+        labelled = visible[np.ix_(label_rows, label_cols)].tolist()
+
+        # Cell centers and label indices, grouped by text color
+        dark_text_cells = []
+        light_text_cells = []
+        for i, row_values in zip(label_rows, labelled):
+            cy = (row_y[i] + row_y[i + 1]) * 0.5
+            for j, correlation in zip(label_cols, row_values):
+                cx = (col_x[j] + col_x[j + 1]) * 0.5
+                if correlation > -0.2:
+                    dark_text_cells.append((cx, cy, round(correlation * 100) + 100))
+                else:
+                    light_text_cells.append((cx, cy, round(correlation * 100) + 100))
+
+        # Second pass for text (all cells share one size), drawn from pre-laid-out static text
+        first_col = label_cols[0]
+        large = col_x[first_col + 1] - col_x[first_col] > 60
+        painter.setFont(self._label_font_large if large else self._label_font_small)
+        static_labels = self._static_labels_large if large else self._static_labels_small
+        for text_pen, cells in ((self._dark_text_pen, dark_text_cells), (self._light_text_pen, light_text_cells)):
+            painter.setPen(text_pen)
+            for cx, cy, label in cells:
+                static_text, half_width, half_height = static_labels[label]
+                painter.drawStaticText(QPointF(cx - half_width, cy - half_height), static_text)
+
+    def _build_static_labels(self, font: QFont) -> list:
+        """Lay out every label of _text_lut once for a font: (static text, half width, half height)."""
+        labels = []
+        for text in self._text_lut:
+            static_text = QStaticText(text)
+            static_text.setTextFormat(Qt.TextFormat.PlainText)
+            static_text.prepare(QTransform(), font)
+            size = static_text.size()
+            labels.append((static_text, size.width() / 2, size.height() / 2))
+        return labels
+
+    def _fill_cells_rects(self, painter: QPainter, color_indices: np.ndarray, col_edges: np.ndarray, row_edges: np.ndarray):
+        """Fill cells with one unstroked drawRects call per color bucket."""
+        xs, ys, ws, hs, bucket_ids, starts = heatmap_cell_geometry(col_edges, row_edges, color_indices)
+        xs, ys, ws, hs, starts = xs.tolist(), ys.tolist(), ws.tolist(), hs.tolist(), starts.tolist()
+
+        # Only QRectF construction stays per cell
+        painter.setPen(Qt.PenStyle.NoPen)
+        for k, bucket in enumerate(bucket_ids.tolist()):
+            lo, hi = starts[k], starts[k + 1]
+            painter.setBrush(self._brush_lut[bucket])
+            painter.drawRects([
+                QRectF(x, y, w, h) for x, y, w, h in zip(xs[lo:hi], ys[lo:hi], ws[lo:hi], hs[lo:hi])
+            ])
+
+    def _fill_cells_downsampled(self, painter: QPainter, cell_px: float, row_start: int, row_end: int, col_start: int, col_end: int):
+        """Fill a sub-pixel grid from the first pyramid level with at least one pixel per cell."""
+        level = min(len(self._correlation_levels) - 1, math.ceil(math.log2(1.0 / cell_px)))
+        scale = 1 << level
+        first_row, first_col = row_start // scale, col_start // scale
+        stop_row, stop_col = -(-row_end // scale), -(-col_end // scale)
+
+        block = self._correlation_levels[level][first_row:stop_row, first_col:stop_col]
+        color_indices = self._code_color_index[block.view(np.uint8)]
+
+        # Coarse cell edges in item units, clamped to the grid for the padded last cell
+        count = float(len(self.articles))
+        col_edges = self.h_ruler.transform(np.minimum(np.arange(first_col, stop_col + 1) * float(scale), count))
+        row_edges = self.v_ruler.transform(np.minimum(np.arange(first_row, stop_row + 1) * float(scale), count))
+        self._fill_cells_image(painter, color_indices, col_edges, row_edges)
+
+    def _fill_cells_image(self, painter: QPainter, color_indices: np.ndarray, col_edges: np.ndarray, row_edges: np.ndarray):
+        """Fill cells by rasterizing one pixel per cell and scaling it over the visible block."""
+        rows, cols = color_indices.shape
+        rgb = np.ascontiguousarray(self._rgb_lut[color_indices])
+        image = QImage(rgb.data, cols, rows, 3 * cols, QImage.Format.Format_RGB888)
+
+        # Rulers are affine, so nearest-neighbor scaling lands every cell on its exact rectangle
+        target = QRectF(col_edges[0], row_edges[0], col_edges[-1] - col_edges[0], row_edges[-1] - row_edges[0])
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform, False)
+        painter.drawImage(target, image)
+        painter.restore()
 
     def eventFilter(self, source, event):
         """Handle tooltips for direct drawing mode."""
@@ -250,86 +518,130 @@ class CorrelationHeatmapWindow(QMainWindow):
                 col = int(self.h_ruler.get_value_at(pos.x()))
                 row = int(self.v_ruler.get_value_at(pos.y()))
 
+                # Moves within the same cell leave the tooltip unchanged
+                if (row, col) == self._last_hover_cell:
+                    return False
+                self._last_hover_cell = (row, col)
+
                 if 0 <= row < len(self.articles) and 0 <= col < len(self.articles):
-                    correlation = self.correlation_matrix[row, col]
-                    tooltip = (
-                        f"{self.articles[row].name} vs {self.articles[col].name}\n"
-                        f"Correlation: {correlation:.3f}"
-                    )
-                    QToolTip.showText(event.globalPosition().toPoint(), tooltip, self.widget.canvas.viewport())
+                    # (Re)start the delay; fast sweeps across many cells format nothing
+                    self._tooltip_pos = event.globalPosition().toPoint()
+                    self._tooltip_timer.start()
                 else:
+                    self._tooltip_timer.stop()
                     QToolTip.hideText()
                 # Don't consume the event, let other handlers process it too
                 return False
+            if event.type() == QEvent.Type.Leave:
+                self._last_hover_cell = None
+                self._tooltip_timer.stop()
 
         return super().eventFilter(source, event)
 
-    def _create_heatmap_items(self):
-        """Create InteractiveItems for small grids only (read-only with tooltips)."""
+    def _sync_heatmap_items(self, painter: QPainter):
+        """Keep InteractiveItems only for the visible cells (plus a margin), creating them on first view."""
+        count = len(self.articles)
+        col_start = max(0, int(self.h_ruler.visible_start) - ITEM_MARGIN_CELLS)
+        col_end = min(count, int(self.h_ruler.visible_stop) + 1 + ITEM_MARGIN_CELLS)
+        row_start = max(0, int(self.v_ruler.visible_start) - ITEM_MARGIN_CELLS)
+        row_end = min(count, int(self.v_ruler.visible_stop) + 1 + ITEM_MARGIN_CELLS)
+
+        cell_range = (row_start, row_end, col_start, col_end)
+        if cell_range == self._cell_items_range:
+            return
+        self._cell_items_range = cell_range
+
+        # Reuse items still in range, create the newly visible ones, drop the rest
+        previous = self._cell_items
+        cell_items = {}
+        for row_idx in range(row_start, row_end):
+            for col_idx in range(col_start, col_end):
+                key = (row_idx, col_idx)
+                item = previous.get(key)
+                cell_items[key] = item if item is not None else self._create_heatmap_item(row_idx, col_idx)
+        self._cell_items = cell_items
+
+        # Swap the handler's item list in place; add_items/remove_items would request another repaint
+        self.interaction.items[:] = cell_items.values()
+
+    def _show_hover_tooltip(self):
+        """Show the tooltip for the hovered cell once the cursor has settled (direct drawing mode)."""
+        if self._last_hover_cell is None:
+            return
+        row, col = self._last_hover_cell
+        correlation = self.correlation_matrix[row, col]
+        tooltip = (
+            f"{self.articles[row].name} vs {self.articles[col].name}\n"
+            f"Correlation: {correlation:.3f}"
+        )
+        QToolTip.showText(self._tooltip_pos, tooltip, self.widget.canvas.viewport())
+
+    def _create_heatmap_item(self, row_idx: int, col_idx: int) -> InteractiveItem:
+        """Create the InteractiveItem for one cell (read-only with tooltip)."""
         from sprintify.navigation.interaction.interaction_item import ItemCapabilities
 
-        for row_idx in range(len(self.articles)):
-            for col_idx in range(len(self.articles)):
-                cell_data = HeatmapCell(
-                    row_idx=row_idx,
-                    col_idx=col_idx,
-                    row_article=self.articles[row_idx],
-                    col_article=self.articles[col_idx],
-                    correlation=self.correlation_matrix[row_idx, col_idx]
-                )
-
-                # Simplified item creation using new capabilities pattern
-                item = InteractiveItem(
-                    data=cell_data,
-                    x=float(col_idx),
-                    y=float(row_idx),
-                    width=1.0,
-                    height=1.0,
-                    capabilities=ItemCapabilities(
-                        can_move=False,
-                        can_resize=False,
-                        resize_handles=set()  # No resize handles
-                    ),
-                    # Tooltip using the standard pattern
-                    tooltip=(
-                        f"{cell_data.row_article.name} vs {cell_data.col_article.name}\n"
-                        f"Correlation: {cell_data.correlation:.3f}"
-                    )
-                )
-
-                # Set visuals directly
-                item.visuals.fill_color = self._get_color_for_correlation(cell_data.correlation)
-                item.visuals.stroke_color = self.color_map.get_object_color("border")
-                item.visuals.stroke_width = 0.5
-
-                self.interaction.add_item(item)
+        cell_data = HeatmapCell(
+            row_idx=row_idx,
+            col_idx=col_idx,
+            row_article=self.articles[row_idx],
+            col_article=self.articles[col_idx],
+            correlation=self._cell_correlations[row_idx][col_idx],
+            color_index=self._cell_color_indices[row_idx][col_idx]
+        )
+
+        # Simplified item creation using new capabilities pattern
+        item = InteractiveItem(
+            data=cell_data,
+            x=float(col_idx),
+            y=float(row_idx),
+            width=1.0,
+            height=1.0,
+            capabilities=ItemCapabilities(
+                can_move=False,
+                can_resize=False,
+                resize_handles=set()  # No resize handles
+            ),
+            # Tooltip using the standard pattern
+            tooltip=(
+                f"{cell_data.row_article.name} vs {cell_data.col_article.name}\n"
+                f"Correlation: {cell_data.correlation:.3f}"
+            )
+        )
+
+        # Set visuals directly
+        item.visuals.fill_color = self._color_lut[cell_data.color_index]
+        item.visuals.stroke_color = self._border_color
+        item.visuals.stroke_width = 0.5
+
+        return item
 
     def _draw_heatmap_cell(self, painter: QPainter, item: InteractiveItem, rect: QRectF):
         """Custom drawing for heatmap cells (small grids only)."""
         cell_data = item.data
 
-        color = self._get_color_for_correlation(cell_data.correlation)
-        painter.setBrush(QBrush(color))
-        painter.setPen(QPen(self.color_map.get_object_color("border"), 0.5))
+        painter.setBrush(self._brush_lut[cell_data.color_index])
+        painter.setPen(self._border_pen)
         painter.drawRect(rect)
 
         if rect.width() > 30:
-            font = QFont()
-            font.setPointSize(8 if rect.width() > 60 else 7)
-            painter.setFont(font)
-
-            text_color = Qt.GlobalColor.black if cell_data.correlation > -0.2 else Qt.GlobalColor.white
-            painter.setPen(QPen(text_color))
+            large = rect.width() > 60
+            painter.setFont(self._label_font_large if large else self._label_font_small)
+            painter.setPen(self._dark_text_pen if cell_data.correlation > -0.2 else self._light_text_pen)
 
-            text = f"{cell_data.correlation:.2f}"
-            painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, text)
+            # Pre-laid-out label from the shared table instead of formatting per paint
+            static_labels = self._static_labels_large if large else self._static_labels_small
+            static_text, half_width, half_height = static_labels[round(cell_data.correlation * 100) + 100]
+            center = rect.center()
+            painter.drawStaticText(QPointF(center.x() - half_width, center.y() - half_height), static_text)
 
 
 if __name__ == "__main__":
     import sys
     from PySide6.QtWidgets import QApplication
 
-    # Fast generation of 1000 products
+    # Fast generation of 1000 products, all patterns stored in one contiguous matrix
+    num_articles = 1000
+    patterns = np.empty((num_articles, 365), dtype=np.float32)
     articles = []
 
     print("Generating 1000 products with sales patterns...")
@@ -338,44 +650,40 @@ if __name__ == "__main__":
     num_clusters = 20
     cluster_bases = []
 
+    generate_sales_patterns(patterns[:num_clusters])
     for i in range(num_clusters):
         base = Article(i, f"Base-{i}", f"Category-{i % 5}")
-        base.generate_sales_pattern_fast()
+        base.sales_pattern = patterns[i]
         articles.append(base)
         cluster_bases.append(base)
 
-    # Generate correlated products for each cluster
-    article_id = num_clusters
-    for base in cluster_bases:
-        # Generate 10-80 correlated products per cluster
-        num_products = random.randint(10, 80)
-        for _ in range(num_products):
-            correlation = random.uniform(0.3, 0.95)
-            article = create_correlated_articles_fast(
-                base.sales_pattern,
-                correlation,
-                article_id,
-                f"P-{article_id}",
-                base.category
-            )
-            articles.append(article)
-            article_id += 1
-
-            if article_id >= 1000:
-                break
-        if article_id >= 1000:
-            break
+    # Generate 10-80 correlated products per cluster (capped at the article limit),
+    # all clusters in one broadcast blend
+    cluster_ends = np.minimum(
+        _rng.integers(10, 80, num_clusters, endpoint=True).cumsum(), num_articles - num_clusters
+    )
+    base_indices = np.repeat(np.arange(num_clusters), np.diff(cluster_ends, prepend=0))
+    first_independent = num_clusters + base_indices.size
+    correlated_patterns(
+        patterns[base_indices],
+        _rng.uniform(0.3, 0.95, base_indices.size),
+        out=patterns[num_clusters:first_independent]
+    )
+    for i, base_index in enumerate(base_indices.tolist(), start=num_clusters):
+        article = Article(i, f"P-{i}", cluster_bases[base_index].category)
+        article.sales_pattern = patterns[i]
+        articles.append(article)
 
     # Fill remaining with independent products
-    while len(articles) < 1000:
+    generate_sales_patterns(patterns[first_independent:])
+    for article_id in range(first_independent, num_articles):
         article = Article(article_id, f"P-{article_id}", f"Category-{article_id % 5}")
-        article.generate_sales_pattern_fast()
+        article.sales_pattern = patterns[article_id]
         articles.append(article)
-        article_id += 1
 
     print(f"Generated {len(articles)} products")
 
     app = QApplication(sys.argv)
-    window = CorrelationHeatmapWindow(articles[:1000])  # Limit to 1000
+    window = CorrelationHeatmapWindow(articles, patterns)
     window.show()
     sys.exit(app.exec())
@@ -11,12 +11,15 @@ Demonstrates:
 - Professional color scheme with clear visual distinction
 """
 
+from bisect import bisect_left, bisect_right
 from datetime import datetime, timedelta
-import random
+import math
 import sys
 from typing import List, Dict, Tuple, Optional, Set
 from collections import defaultdict
+from operator import attrgetter
 
+import numpy as np
 from PySide6.QtCore import Qt, QTimer
 from PySide6.QtGui import QColor
 from PySide6.QtWidgets import QApplication, QMainWindow, QToolBar, QLabel, QPushButton, QSpinBox
@@ -34,28 +37,65 @@ from sprintify.navigation.interaction.selection import InteractionHandler
 from sprintify.navigation.navigation_widget import NavigationWidget
 from sprintify.navigation.rulers import ItemRuler, TimelineRuler
 
+# Resolution of the overlap index: items are registered in every bucket they touch
+OVERLAP_BUCKET = timedelta(hours=1)
+_MICROSECOND = timedelta(microseconds=1)
+_BUCKET_US = OVERLAP_BUCKET // _MICROSECOND
+_NO_INTERVALS = np.empty(0, dtype=np.int64)
+_start_key = attrgetter("_x_us")
+
+# Interaction area inside the row: leave some space above/below
+ITEM_INTERACTION_RECT = (0.0, 0.12, 1.0, 0.88)
+
+# Schedule item kinds; callbacks dispatch on these instead of isinstance
+KIND_VACATION = 0
+KIND_SHIFT = 1
+
+
+def _constrain_vacation(item: InteractiveItem) -> Tuple[datetime, float, timedelta, float]:
+    """Drag constraint for vacations: force them to stay with the original employee."""
+    return (item.x, float(item.data.original_employee), item.width, item.height)
+
+
+def _constrain_shift(item: InteractiveItem) -> Tuple[datetime, float, timedelta, float]:
+    """Drag constraint for shifts: force them to stay at the original time."""
+    return (item.data.original_start, item.y, item.width, item.height)
+
 
 class ScheduleItem:
     """Base class for schedule items (shifts/vacations)."""
-    def __init__(self, start: datetime, duration: timedelta, employee_id: int, item_type: str):
+    __slots__ = ("start", "duration", "employee_id", "item_type", "kind",
+                 "original_start", "original_employee")
+
+    def __init__(self, start: datetime, duration: timedelta, employee_id: int, item_type: str, kind: int):
         self.start = start
         self.duration = duration
         self.employee_id = employee_id
         self.item_type = item_type
+        self.kind = kind
         self.original_start = start  # For shifts to snap back
         self.original_employee = employee_id  # For vacations to snap back
 
 
 class Vacation(ScheduleItem):
     """Vacation - personal to employee, flexible in time."""
+    __slots__ = ()
+
     def __init__(self, start: datetime, duration: timedelta, employee_id: int):
-        super().__init__(start, duration, employee_id, "vacation")
+        super().__init__(start, duration, employee_id, "vacation", KIND_VACATION)
 
 
 class Shift(ScheduleItem):
     """Work shift - transferable between employees, fixed in time."""
+    __slots__ = ()
+
     def __init__(self, start: datetime, duration: timedelta, employee_id: int):
-        super().__init__(start, duration, employee_id, "shift")
+        super().__init__(start, duration, employee_id, "shift", KIND_SHIFT)
+
+
+def _sync_schedule(schedule_item: ScheduleItem) -> Tuple[datetime, float, timedelta, float]:
+    """Item geometry for a vacation or shift; shared sync_from_data callback."""
+    return (schedule_item.start, float(schedule_item.employee_id), schedule_item.duration, 1.0)
 
 
 class SchedulingApp(QMainWindow):
@@ -69,6 +109,12 @@ class SchedulingApp(QMainWindow):
         self.end_date = datetime(2024, 3, 1)
         self.num_employees = 1000
 
+        # Midnight of every day in the planning period, for day snapping
+        self._midnights = [
+            self.start_date + timedelta(days=i)
+            for i in range((self.end_date - self.start_date).days + 1)
+        ]
+
         # Color scheme
         self.color_map = ColorMap(darkmode=True)
 
@@ -77,6 +123,8 @@ class SchedulingApp(QMainWindow):
         self.vacation_border = self.color_map.get_saturated_color("amber", "border")
         self.shift_color = self.color_map.get_saturated_color("blue", "fill")  # Blue for working
         self.shift_border = self.color_map.get_saturated_color("blue", "border")
+        self._kind_colors = (self.vacation_color, self.shift_color)  # indexed by kind
+        self.default_gray = QColor(128, 128, 128)
 
         # Create rulers
         self.time_ruler = TimelineRuler(
@@ -102,8 +150,9 @@ class SchedulingApp(QMainWindow):
             self.color_map
         )
 
-        # Set employee labels
-        self.nav_widget.left_ruler_widget.get_label = lambda i: f"Emp {i+1:04d}"
+        # Set employee labels, formatted once instead of on every repaint
+        self._emp_labels = [f"Emp {i+1:04d}" for i in range(self.num_employees)]
+        self.nav_widget.left_ruler_widget.get_label = self._emp_labels.__getitem__
 
         # Status label for feedback - create early before any method that might use it
         self.status_label = QLabel("Ready")
@@ -124,13 +173,39 @@ class SchedulingApp(QMainWindow):
         # Configure interaction
         self.setup_interaction()
 
-        # Spatial index for efficient overlap checking (employee -> sorted list of items by start time)
-        self.employee_schedule_index: Dict[int, List[InteractiveItem]] = defaultdict(list)
+        # Per-employee schedule ordered by start time
+        self.employee_schedule_index: Dict[int, List[InteractiveItem]] = {}
+        # Parallel start keys (microseconds since start_date) for bisect
+        self._index_keys: Dict[int, List[int]] = {}
+        # Bumped on every index change; invalidates the visible_items cache
+        self._index_version = 0
+        self._visible_cache_key = None
+        self._visible_cache: List[InteractiveItem] = []
+        # (first start, last end) in microseconds per employee, None for an empty
+        # schedule; a list indexed by employee since the employee count is fixed
+        self._emp_envelope: List[Optional[Tuple[int, int]]] = [None] * self.num_employees
+
+        # Overlap index: (employee, hour bucket since start_date) -> items touching that bucket
+        self.bucket_index: Dict[Tuple[int, int], List[InteractiveItem]] = defaultdict(list)
+
+        # Item bounds for the stats counter, one row per item (see _store_bounds)
+        self._item_rows: Dict[InteractiveItem, int] = {}
+        self._reset_bounds()
+
+        # Item counts by kind, maintained as items are created
+        self._n_vacations = 0
+        self._n_shifts = 0
 
         # Generate initial schedule
         self.generate_schedule()
 
-        # Performance timer for stats
+        # Coalesces repaint requests into one update per event-loop turn
+        self._update_pending = False
+
+        # Performance timer for stats; only recomputes after a drop or a viewport change
+        self._stats_dirty = True
+        self._stats_view_key = None
+        self._last_stats = None
         self.stats_timer = QTimer()
         self.stats_timer.timeout.connect(self.update_stats)
         self.stats_timer.start(1000)
@@ -178,6 +253,17 @@ class SchedulingApp(QMainWindow):
             self.num_employees,
             self.employee_ruler.visible_start + visible_count
         )
+        self._request_update()
+
+    def _request_update(self):
+        """Schedule a single repaint of the navigation widget for the next event-loop turn."""
+        if self._update_pending:
+            return
+        self._update_pending = True
+        QTimer.singleShot(0, self._flush_update)
+
+    def _flush_update(self):
+        self._update_pending = False
         self.nav_widget.update()
 
     def setup_interaction(self):
@@ -186,28 +272,24 @@ class SchedulingApp(QMainWindow):
         # Item-aware snap functions
         def snap_x_move(x: datetime, item: InteractiveItem) -> datetime:
             """Snap X during move based on item type."""
-            if isinstance(item.data, Vacation):
+            if item.data.kind == KIND_VACATION:
                 # Vacations can move in time, snap to start of day
-                return x.replace(hour=0, minute=0, second=0, microsecond=0)
-            elif isinstance(item.data, Shift):
-                # Shifts must stay at original time
-                return item.data.original_start
-            return x
+                return self._midnight(x)
+            # Shifts must stay at original time
+            return item.data.original_start
 
         def snap_y_move(y: float, item: InteractiveItem) -> float:
             """Snap Y during move based on item type."""
-            if isinstance(item.data, Vacation):
+            if item.data.kind == KIND_VACATION:
                 # Vacations must stay with original employee
                 return float(item.data.original_employee)
-            elif isinstance(item.data, Shift):
-                # Shifts can move between employees - ensure float return
-                return float(round(y))
+            # Shifts can move between employees - ensure float return
             return float(round(y))
 
         def snap_x_resize(x: datetime, item: InteractiveItem) -> datetime:
             """Snap X during resize - vacations snap to day boundaries."""
-            if isinstance(item.data, Vacation):
-                return x.replace(hour=0, minute=0, second=0, microsecond=0)
+            if item.data.kind == KIND_VACATION:
+                return self._midnight(x)
             # Shifts can't be resized (handled by capabilities)
             return x
 
@@ -218,24 +300,9 @@ class SchedulingApp(QMainWindow):
         )
 
         # NEW: Use on_drag_update for clean constraint enforcement
-        def constrain_drag(item: InteractiveItem) -> Optional[Tuple[datetime, float, timedelta, float]]:
-            """Apply hard constraints during drag.
-
-            Returns:
-                None if no constraint needed, or (x, y, width, height) tuple to override position
-            """
-            schedule_item = item.data
-
-            if isinstance(schedule_item, Vacation):
-                # Force vacation to stay with original employee
-                return (item.x, float(schedule_item.original_employee), item.width, item.height)
-            elif isinstance(schedule_item, Shift):
-                # Force shift to stay at original time
-                return (schedule_item.original_start, item.y, item.width, item.height)
-
-            return None  # No constraint needed
-
-        self.interaction.on_drag_update = constrain_drag
+        # Each item carries the constraint for its kind (set at creation), so no
+        # type dispatch happens per mouse move
+        self.interaction.on_drag_update = lambda item: item._constrain(item)
 
         # Global size constraints (can be overridden per-item)
         # Keep these as defaults, but items can override
@@ -251,29 +318,40 @@ class SchedulingApp(QMainWindow):
         self.interaction.on_drop = self.handle_drop
 
         # Visual configuration
-        self.interaction.item_corner_radius = 4
+        # Shifts are drawn with square corners (vacations keep their own rounded
+        # corner_radius): plain rectangles let the handler paint runs of shifts
+        # with a single drawRects call instead of one rounded rect each
+        self.interaction.item_corner_radius = 0
+        # Shift blocks are axis-aligned, so fill them on the raster engine's fast
+        # non-antialiased path; their 1 px borders snap to whole pixels
+        self.interaction.antialias_plain_rects = False
         self.interaction.get_item_color = self.get_item_color
         self.interaction.get_item_label = self.get_item_label
+        self.interaction.get_visible_items = self.visible_items
         self.interaction.show_tooltips = True
 
+    def _midnight(self, x: datetime) -> datetime:
+        """Start of the day containing x."""
+        day = (x - self.start_date).days
+        if 0 <= day < len(self._midnights):
+            return self._midnights[day]
+        return x.replace(hour=0, minute=0, second=0, microsecond=0)
+
     def get_item_color(self, item: InteractiveItem) -> QColor:
         """Get color based on item type."""
-        schedule_item = item.data
-        if isinstance(schedule_item, Vacation):
-            return self.vacation_color
-        elif isinstance(schedule_item, Shift):
-            return self.shift_color
-        return QColor(128, 128, 128)
+        if item.data is None:
+            return self.default_gray
+        return self._kind_colors[item.data.kind]
 
     def get_item_label(self, item: InteractiveItem) -> str:
         """Get label for item."""
         schedule_item = item.data
-        if isinstance(schedule_item, Vacation):
+        if schedule_item is None:
+            return ""
+        if schedule_item.kind == KIND_VACATION:
             return "VAC"
-        elif isinstance(schedule_item, Shift):
-            hours = int(schedule_item.duration.total_seconds() / 3600)
-            return f"{hours}h"
-        return ""
+        hours = int(schedule_item.duration.total_seconds() / 3600)
+        return f"{hours}h"
 
     def validate_drop(self, items: List[InteractiveItem]) -> bool:
         """Pure validation - check bounds and overlaps, no side effects."""
@@ -291,74 +369,56 @@ class SchedulingApp(QMainWindow):
             if self.has_overlap_efficient(item, emp_id, items):
                 return False  # Return False to show red/invalid state
 
+        # The check above skips the other dragged items, so also reject drops that
+        # land them on top of each other; visible_items relies on disjoint rows
+        if len(items) > 1:
+            spans_by_row = defaultdict(list)
+            for item in items:
+                spans_by_row[int(round(item.y))].append((item.x, item.x + item.width))
+            for spans in spans_by_row.values():
+                spans.sort()
+                for (_, prev_end), (start, _) in zip(spans, spans[1:]):
+                    if start < prev_end:
+                        return False
+
         return True
 
+    def _buckets(self, start: datetime, end: datetime) -> range:
+        """Overlap buckets covered by the half-open interval [start, end)."""
+        first = (start - self.start_date) // OVERLAP_BUCKET
+        last = (end - self.start_date - _MICROSECOND) // OVERLAP_BUCKET
+        return range(first, last + 1)
+
     def has_overlap_efficient(self, item: InteractiveItem, emp_id: int,
                              dragged_items: List[InteractiveItem]) -> bool:
-        """Efficiently check if item overlaps using spatial index.
+        """Efficiently check if item overlaps using the bucket index.
 
-        O(log n) using binary search on sorted employee schedule.
+        Probes only the buckets spanned by the item, so the cost depends on the
+        item's duration rather than on how busy the employee's schedule is.
         """
-        item_start = item.x
-        item_end = item.x + item.width
-
-        # Get schedule for this employee from index
-        employee_schedule = self.employee_schedule_index.get(emp_id, [])
-
-        if not employee_schedule:
+        # Compare integer microseconds; indexed items carry their committed
+        # position in _x_us/_w_us (see _add_to_schedule_index)
+        item_start = (item.x - self.start_date) // _MICROSECOND
+        item_end = item_start + item.width // _MICROSECOND
+
+        # Nothing to scan when the item lies outside the employee's whole schedule
+        envelope = self._emp_envelope[emp_id]
+        if envelope is None or item_end <= envelope[0] or item_start >= envelope[1]:
             return False
 
-        # Find insertion point using binary search
-        left_idx = 0
-        right_idx = len(employee_schedule)
-
-        while left_idx < right_idx:
-            mid_idx = (left_idx + right_idx) // 2
-            mid_item = employee_schedule[mid_idx]
-            if mid_item.x < item_start:
-                left_idx = mid_idx + 1
-            else:
-                right_idx = mid_idx
-
-        # Robust overlap check: scan backward and forward from insertion point
-        # Backward scan: check all items that might extend into our range
-        check_idx = left_idx - 1
-        while check_idx >= 0:
-            other_item = employee_schedule[check_idx]
-
-            # Skip if it's the same item or another dragged item
-            if other_item == item or other_item in dragged_items:
-                check_idx -= 1
-                continue
-
-            other_end = other_item.x + other_item.width
-
-            # Stop scanning when items can no longer overlap
-            if other_end <= item_start:
-                break
-
-            # Check for overlap
-            if item_start < other_end and item_end > other_item.x:
-                return True
-
-            check_idx -= 1
-
-        # Forward scan: check all items starting from insertion point
-        for idx in range(left_idx, len(employee_schedule)):
-            other_item = employee_schedule[idx]
+        bucket_index = self.bucket_index
 
-            # Skip if it's the same item or another dragged item
-            if other_item == item or other_item in dragged_items:
+        for bucket in range(item_start // _BUCKET_US, (item_end - 1) // _BUCKET_US + 1):
+            others = bucket_index.get((emp_id, bucket))
+            if not others:
                 continue
-
-            # Stop scanning when items can no longer overlap
-            if other_item.x >= item_end:
-                break
-
-            # Check for overlap
-            other_end = other_item.x + other_item.width
-            if item_start < other_end and item_end > other_item.x:
-                return True
+            for other_item in others:
+                # Skip if it's the same item or another dragged item
+                if other_item is item or other_item in dragged_items:
+                    continue
+                other_start = other_item._x_us
+                if item_start < other_start + other_item._w_us and item_end > other_start:
+                    return True
 
         return False
 
@@ -370,10 +430,12 @@ class SchedulingApp(QMainWindow):
 
     def handle_drop(self, items: List[InteractiveItem]):
         """Handle successful drop - sync model with item positions and update index."""
+        # Unindex while the data model still holds the committed positions the
+        # indexes were built from; dropped items are re-added after syncing
         for item in items:
-            old_emp_id = item.data.employee_id
-            old_start = item.data.start
+            self._remove_from_schedule_index(item)
 
+        for item in items:
             # Update the data model from item position
             # Use sync_to_data if available, otherwise update manually
             if hasattr(item, 'sync_to_data') and callable(item.sync_to_data):
@@ -387,69 +449,216 @@ class SchedulingApp(QMainWindow):
 
             # The sync_to_data handles common patterns, but we can still do custom logic:
             schedule_item = item.data
-            if isinstance(schedule_item, Vacation):
+            if schedule_item.kind == KIND_VACATION:
                 # Ensure original_employee stays unchanged (safety check)
                 schedule_item.employee_id = schedule_item.original_employee
 
-            new_emp_id = schedule_item.employee_id
-            new_start = schedule_item.start
-
-            # Update spatial index if employee or time changed
-            needs_reindex = (old_emp_id != new_emp_id) or (old_start != new_start)
-
-            if needs_reindex:
-                # Remove from old employee's schedule
-                if old_emp_id in self.employee_schedule_index:
-                    self.employee_schedule_index[old_emp_id] = [
-                        i for i in self.employee_schedule_index[old_emp_id] if i != item
-                    ]
-
-                # Add to new/same employee's schedule in correct position
-                self._add_to_schedule_index(new_emp_id, item)
+            # Add to new/same employee's schedule in correct position
+            self._add_to_schedule_index(schedule_item.employee_id, item)
 
+        self._stats_dirty = True
         self.status_label.setText(f"Moved {len(items)} item(s)")
-        self.nav_widget.update()
+        self._request_update()
 
-    def _add_to_schedule_index(self, emp_id: int, item: InteractiveItem):
-        """Add item to employee's schedule maintaining sorted order."""
-        schedule = self.employee_schedule_index[emp_id]
+    def _remove_from_schedule_index(self, item: InteractiveItem):
+        """Remove item from the indexes, located by its committed data position."""
+        schedule_item = item.data
+        emp_id = schedule_item.employee_id
+        start = schedule_item.start
+        self._index_version += 1
+
+        schedule = self.employee_schedule_index.get(emp_id)
+        if schedule is not None:
+            keys = self._index_keys[emp_id]
+            # Bisect to the first item starting at the same time, then scan the tie group
+            idx = bisect_left(keys, item._x_us)
+            while idx < len(schedule) and schedule[idx] is not item:
+                idx += 1
+            if idx < len(schedule):
+                schedule.pop(idx)
+                keys.pop(idx)
+                if not schedule:
+                    # Don't keep empty entries around for employees without items
+                    del self.employee_schedule_index[emp_id]
+                    del self._index_keys[emp_id]
+                envelope = self._emp_envelope[emp_id]
+                if item._x_us == envelope[0] or item._x_us + item._w_us == envelope[1]:
+                    # The removed item may have defined a bound
+                    self._update_envelope(emp_id)
+
+        bucket_index = self.bucket_index
+        for bucket in self._buckets(start, start + schedule_item.duration):
+            others = bucket_index[(emp_id, bucket)]
+            others.remove(item)
+            if not others:
+                del bucket_index[(emp_id, bucket)]
+
+    def _update_envelope(self, emp_id: int):
+        """Recompute the schedule envelope of one employee."""
+        schedule = self.employee_schedule_index.get(emp_id)
+        if not schedule:
+            self._emp_envelope[emp_id] = None
+            return
+        # Take the latest end over the row; the last item by start need not end last
+        self._emp_envelope[emp_id] = (schedule[0]._x_us, max(i._x_us + i._w_us for i in schedule))
 
-        # Binary search for insertion point
-        left, right = 0, len(schedule)
-        while left < right:
-            mid = (left + right) // 2
-            if schedule[mid].x < item.x:
-                left = mid + 1
-            else:
-                right = mid
+    def _add_to_schedule_index(self, emp_id: int, item: InteractiveItem, keep_sorted: bool = True):
+        """Add item to employee's schedule maintaining sorted order.
 
-        schedule.insert(left, item)
+        With keep_sorted=False the item is appended instead; callers adding many
+        items must call _sort_schedule_index() before the index is queried.
+        """
+        self._index_version += 1
+
+        # Integer copies of the committed position for the index and overlap scan
+        item._x_us = (item.x - self.start_date) // _MICROSECOND
+        item._w_us = item.width // _MICROSECOND
+
+        keys = self._index_keys.get(emp_id)
+        if keys is None:
+            keys = self._index_keys[emp_id] = []
+            self.employee_schedule_index[emp_id] = []
+        if keep_sorted:
+            idx = bisect_left(keys, item._x_us)
+            keys.insert(idx, item._x_us)
+            self.employee_schedule_index[emp_id].insert(idx, item)
+        else:
+            keys.append(item._x_us)
+            self.employee_schedule_index[emp_id].append(item)
+
+        envelope = self._emp_envelope[emp_id]
+        item_end = item._x_us + item._w_us
+        if envelope is None:
+            self._emp_envelope[emp_id] = (item._x_us, item_end)
+        elif item._x_us < envelope[0] or item_end > envelope[1]:
+            self._emp_envelope[emp_id] = (min(envelope[0], item._x_us), max(envelope[1], item_end))
+
+        for bucket in self._buckets(item.x, item.x + item.width):
+            self.bucket_index[(emp_id, bucket)].append(item)
+
+        self._store_bounds(item)
+
+    def visible_items(self, x_min: datetime, x_max: datetime, y_min: float, y_max: float) -> List[InteractiveItem]:
+        """Items whose committed position may intersect the given data range.
+
+        Walks only the employee rows in range and bisects each row's start keys,
+        so the cost follows what is on screen rather than the total item count.
+        Repeated range queries (repaints without scrolling) return the cached list.
+        """
+        # Point queries from hit-testing are cheap and would only evict the
+        # viewport result, so only range queries go through the cache
+        cacheable = x_min != x_max
+        if cacheable:
+            key = (x_min, x_max, y_min, y_max, self._index_version)
+            if key == self._visible_cache_key:
+                return self._visible_cache
+
+        x_min_us = (x_min - self.start_date) // _MICROSECOND
+        x_max_us = (x_max - self.start_date) // _MICROSECOND
+        keys_by_emp = self._index_keys
+        envelopes = self._emp_envelope
+
+        # Row emp_id spans [emp_id, emp_id + 1], so it touches the range when
+        # emp_id >= y_min - 1 and emp_id <= y_max
+        first_row = max(0, math.ceil(y_min) - 1)
+        last_row = min(self.num_employees - 1, math.floor(y_max))
+
+        found: List[InteractiveItem] = []
+        for emp_id in range(first_row, last_row + 1):
+            # Whole-row short-circuit: skip rows whose schedule lies outside the window
+            envelope = envelopes[emp_id]
+            if envelope is None or envelope[1] < x_min_us or envelope[0] > x_max_us:
+                continue
+            keys = keys_by_emp[emp_id]
+            schedule = self.employee_schedule_index[emp_id]
+            lo = bisect_left(keys, x_min_us)
+            # Committed items don't overlap, so only the item just before the
+            # window can start earlier and still reach into it
+            if lo and schedule[lo - 1]._x_us + schedule[lo - 1]._w_us >= x_min_us:
+                lo -= 1
+            hi = bisect_right(keys, x_max_us)
+            if lo < hi:
+                found.extend(schedule[lo:hi])
+
+        if cacheable:
+            self._visible_cache_key = key
+            self._visible_cache = found
+        return found
+
+    def _sort_schedule_index(self):
+        """Restore start order of every employee schedule after unsorted appends."""
+        for emp_id, schedule in self.employee_schedule_index.items():
+            schedule.sort(key=_start_key)
+            self._index_keys[emp_id] = [item._x_us for item in schedule]
+
+    def _reset_bounds(self, capacity: int = 1024):
+        """Drop all stored item bounds."""
+        self._item_rows.clear()
+        self._items_starts_us = np.zeros(capacity, dtype=np.int64)
+        self._items_ends_us = np.zeros(capacity, dtype=np.int64)
+        self._items_ymin = np.zeros(capacity)
+        self._items_ymax = np.zeros(capacity)
+
+    def _store_bounds(self, item: InteractiveItem):
+        """Write item's bounds into its row of the stats arrays, growing them if needed."""
+        row = self._item_rows.get(item)
+        if row is None:
+            row = len(self._item_rows)
+            self._item_rows[item] = row
+            if row == len(self._items_starts_us):
+                extra = len(self._items_starts_us)
+                self._items_starts_us = np.concatenate([self._items_starts_us, np.zeros(extra, dtype=np.int64)])
+                self._items_ends_us = np.concatenate([self._items_ends_us, np.zeros(extra, dtype=np.int64)])
+                self._items_ymin = np.concatenate([self._items_ymin, np.zeros(extra)])
+                self._items_ymax = np.concatenate([self._items_ymax, np.zeros(extra)])
+
+        self._items_starts_us[row] = item._x_us
+        self._items_ends_us[row] = item._x_us + item._w_us
+        self._items_ymin[row] = item.y
+        self._items_ymax[row] = item.y + item.height
 
     def generate_schedule(self):
         """Generate initial schedule with vacations and shifts."""
-        random.seed(42)  # For reproducibility
+        rng = np.random.default_rng(42)  # For reproducibility
 
         # Clear the spatial index
         self.employee_schedule_index.clear()
-
-        # Generate vacations (5% of employees)
-        vacation_employees = random.sample(
-            range(self.num_employees),
-            k=int(self.num_employees * 0.05)
+        self._index_keys.clear()
+        self._emp_envelope = [None] * self.num_employees
+        self._n_vacations = 0
+        self._n_shifts = 0
+        self.bucket_index.clear()
+        self._reset_bounds()
+
+        # Capabilities are never mutated per item, so every item of a kind shares one
+        vacation_capabilities = ItemCapabilities(
+            can_move=True,
+            can_resize=True,  # Vacations can be resized
+            resize_handles={ResizeHandle.LEFT, ResizeHandle.RIGHT},
+            # Vacation-specific size constraints
+            min_width=timedelta(days=1),   # 1 day minimum
+            max_width=timedelta(days=21),  # 3 weeks maximum
+        )
+        shift_capabilities = ItemCapabilities(
+            can_move=True,
+            can_resize=False  # Shifts have fixed duration (no resize at all)
+            # No need to specify size constraints for non-resizable items
         )
 
-        for emp_id in vacation_employees:
-            # Random vacation between 1-3 weeks, starting on a Monday
-            max_start = self.end_date - timedelta(days=21)
-            days_range = (max_start - self.start_date).days
-            start_day = random.randint(0, max(0, days_range))
-            vac_start = self.start_date + timedelta(days=start_day)
-
-            # Snap to start of day
-            vac_start = vac_start.replace(hour=0, minute=0, second=0, microsecond=0)
-
-            # Random duration between 1 day and 3 weeks
-            duration_days = random.randint(1, 21)
+        # Generate vacations (5% of employees), all random draws in one batch
+        num_vacations = int(self.num_employees * 0.05)
+        vacation_employees = rng.choice(self.num_employees, size=num_vacations, replace=False)
+        # Random start day, leaving room for up to 3 weeks before the period ends
+        days_range = max(0, (self.end_date - timedelta(days=21) - self.start_date).days)
+        vacation_start_days = rng.integers(0, days_range + 1, size=num_vacations)
+        # Random duration between 1 day and 3 weeks
+        vacation_durations = rng.integers(1, 22, size=num_vacations)
+
+        for emp_id, start_day, duration_days in zip(vacation_employees.tolist(),
+                                                    vacation_start_days.tolist(),
+                                                    vacation_durations.tolist()):
+            # Starts at midnight
+            vac_start = self._midnights[start_day]
             duration = timedelta(days=duration_days)
 
             vacation = Vacation(
@@ -465,18 +674,10 @@ class SchedulingApp(QMainWindow):
                 y=float(emp_id),
                 width=vacation.duration,
                 height=1.0,
-                capabilities=ItemCapabilities(
-                    can_move=True,
-                    can_resize=True,  # Vacations can be resized
-                    resize_handles={ResizeHandle.LEFT, ResizeHandle.RIGHT},
-                    # Vacation-specific size constraints
-                    min_width=timedelta(days=1),   # 1 day minimum
-                    max_width=timedelta(days=21),  # 3 weeks maximum
-                ),
-                # leave some space above/below inside row
-                interaction_rect=(0.0, 0.12, 1.0, 0.88),
+                capabilities=vacation_capabilities,
+                interaction_rect=ITEM_INTERACTION_RECT,
                 # NEW: Define how to sync from data back to item
-                sync_from_data=lambda v: (v.start, float(v.employee_id), v.duration, 1.0)
+                sync_from_data=_sync_schedule
             )
 
             # Set visual properties
@@ -484,6 +685,7 @@ class SchedulingApp(QMainWindow):
             item.visuals.stroke_color = self.vacation_border
             item.visuals.shape = ItemShape.ROUNDED_RECT
             item.visuals.corner_radius = 4
+            item._constrain = _constrain_vacation
 
             # Update label to show duration
             days = int(vacation.duration.total_seconds() / 86400)
@@ -493,88 +695,108 @@ class SchedulingApp(QMainWindow):
             item.tooltip = f"Vacation: Employee {emp_id+1} ({days} days) - resize with edges, move in time only"
 
             self.interaction.add_item(item)
+            self._n_vacations += 1
+
+            # Add to spatial index (sorted once generation is done)
+            self._add_to_schedule_index(emp_id, item, keep_sorted=False)
 
-            # Add to spatial index
-            self._add_to_schedule_index(emp_id, item)
+        # Occupied intervals per employee as sorted int64 microseconds since
+        # start_date, so each shift candidate is tested with one searchsorted
+        self._sort_schedule_index()
+        starts_us: Dict[int, np.ndarray] = {}
+        ends_us: Dict[int, np.ndarray] = {}
+        for emp_id, schedule in self.employee_schedule_index.items():
+            starts_us[emp_id] = np.array([i._x_us for i in schedule], dtype=np.int64)
+            ends_us[emp_id] = np.array([i._x_us + i._w_us for i in schedule], dtype=np.int64)
+        hour_us = timedelta(hours=1) // _MICROSECOND
 
         # Generate shifts (spread across employees, weekdays only)
-        current_date = self.start_date
-        while current_date < self.end_date:
-            # Skip weekends
-            if current_date.weekday() < 5:  # Monday = 0, Friday = 4
-                # Generate 20-40 shifts per day (distributed across employees)
-                num_shifts = random.randint(20, 40)
-
-                for _ in range(num_shifts):
-                    emp_id = random.randint(0, self.num_employees - 1)
-
-                    # Random shift between 6:00 and 22:00, 5-10 hours long
-                    start_hour = random.randint(6, 16)  # Latest start at 16:00
-                    duration_hours = random.randint(5, min(10, 22 - start_hour))
-
-                    shift_start = current_date.replace(hour=start_hour, minute=0, second=0, microsecond=0)
-
-                    # Use efficient overlap check with spatial index
-                    dummy_item = InteractiveItem(
-                        data=None,
-                        x=shift_start,
-                        y=float(emp_id),
-                        width=timedelta(hours=duration_hours),
-                        height=1.0
-                    )
-
-                    has_conflict = self.has_overlap_efficient(dummy_item, emp_id, [])
-
-                    if not has_conflict:
-                        shift = Shift(
-                            start=shift_start,
-                            duration=timedelta(hours=duration_hours),
-                            employee_id=emp_id
-                        )
-
-                        # Create interactive item with model sync
-                        item = InteractiveItem(
-                            data=shift,
-                            x=shift.start,
-                            y=float(emp_id),
-                            width=shift.duration,
-                            height=1.0,
-                            capabilities=ItemCapabilities(
-                                can_move=True,
-                                can_resize=False  # Shifts have fixed duration (no resize at all)
-                                # No need to specify size constraints for non-resizable items
-                            ),
-                            # leave some space above/below inside row
-                            interaction_rect=(0.0, 0.12, 1.0, 0.88),
-                            # NEW: Define how to sync from data back to item
-                            sync_from_data=lambda s: (s.start, float(s.employee_id), s.duration, 1.0)
-                        )
-
-                        # Set visual properties
-                        item.visuals.fill_color = self.shift_color
-                        item.visuals.stroke_color = self.shift_border
-                        item.visuals.shape = ItemShape.RECTANGLE
-                        item.visuals.label = f"{duration_hours}h"
-
-                        # Tooltip
-                        item.tooltip = f"Shift: {duration_hours}h @ Employee {emp_id+1} (move between employees only)"
-
-                        self.interaction.add_item(item)
-
-                        # Add to spatial index
-                        self._add_to_schedule_index(emp_id, item)
-
-            current_date += timedelta(days=1)
+        weekdays = [day for day in self._midnights[:-1] if day.weekday() < 5]  # Monday = 0, Friday = 4
+        # 20-40 shifts per day (distributed across employees), drawn for all days at once
+        shifts_per_day = rng.integers(20, 41, size=len(weekdays))
+        num_candidates = int(shifts_per_day.sum())
+        candidate_days = np.repeat(np.arange(len(weekdays)), shifts_per_day)
+        candidate_employees = rng.integers(0, self.num_employees, size=num_candidates)
+        # Random shift between 6:00 and 22:00, 5-10 hours long
+        candidate_hours = rng.integers(6, 17, size=num_candidates)  # Latest start at 16:00
+        candidate_durations = rng.integers(5, np.minimum(10, 22 - candidate_hours) + 1)
+
+        for day, emp_id, start_hour, duration_hours in zip(candidate_days.tolist(),
+                                                            candidate_employees.tolist(),
+                                                            candidate_hours.tolist(),
+                                                            candidate_durations.tolist()):
+            shift_start = weekdays[day] + timedelta(hours=start_hour)
+
+            # Intervals are disjoint, so the first one ending after the
+            # candidate's start is the only one that can overlap it
+            shift_start_us = (shift_start - self.start_date) // _MICROSECOND
+            shift_end_us = shift_start_us + duration_hours * hour_us
+            emp_starts = starts_us.get(emp_id, _NO_INTERVALS)
+            emp_ends = ends_us.get(emp_id, _NO_INTERVALS)
+            idx = int(np.searchsorted(emp_ends, shift_start_us, side='right'))
+            has_conflict = idx < len(emp_starts) and emp_starts[idx] < shift_end_us
+
+            if not has_conflict:
+                starts_us[emp_id] = np.insert(emp_starts, idx, shift_start_us)
+                ends_us[emp_id] = np.insert(emp_ends, idx, shift_end_us)
+
+                shift = Shift(
+                    start=shift_start,
+                    duration=timedelta(hours=duration_hours),
+                    employee_id=emp_id
+                )
+
+                # Create interactive item with model sync
+                item = InteractiveItem(
+                    data=shift,
+                    x=shift.start,
+                    y=float(emp_id),
+                    width=shift.duration,
+                    height=1.0,
+                    capabilities=shift_capabilities,
+                    interaction_rect=ITEM_INTERACTION_RECT,
+                    # NEW: Define how to sync from data back to item
+                    sync_from_data=_sync_schedule
+                )
+
+                # Set visual properties
+                item.visuals.fill_color = self.shift_color
+                item.visuals.stroke_color = self.shift_border
+                item.visuals.shape = ItemShape.RECTANGLE
+                item.visuals.label = f"{duration_hours}h"
+                item._constrain = _constrain_shift
+
+                # Tooltip
+                item.tooltip = f"Shift: {duration_hours}h @ Employee {emp_id+1} (move between employees only)"
+
+                self.interaction.add_item(item)
+                self._n_shifts += 1
+
+                # Add to spatial index (sorted once generation is done)
+                self._add_to_schedule_index(emp_id, item, keep_sorted=False)
+
+        self._sort_schedule_index()
 
         self.status_label.setText(
-            f"Generated {len([i for i in self.interaction.items if isinstance(i.data, Vacation)])} vacations, "
-            f"{len([i for i in self.interaction.items if isinstance(i.data, Shift)])} shifts"
+            f"Generated {self._n_vacations} vacations, {self._n_shifts} shifts"
         )
 
     def update_stats(self):
         """Update performance statistics."""
-        visible_items = 0
+        # Poll less often while the window is hidden
+        self.stats_timer.setInterval(1000 if self.isVisible() else 5000)
+
         viewport_rect = self.nav_widget.canvas.viewport().rect()
+        # The rulers don't emit change signals, so detect scroll/zoom/resize by key
+        view_key = (
+            self.time_ruler.visible_start, self.time_ruler.visible_stop,
+            self.employee_ruler.visible_start, self.employee_ruler.visible_stop,
+            viewport_rect.width(), viewport_rect.height(),
+        )
+        if not self._stats_dirty and view_key == self._stats_view_key:
+            return
+        self._stats_dirty = False
+        self._stats_view_key = view_key
 
         # Count visible items (demonstrates culling)
         x_min = self.time_ruler.get_value_at(0)
@@ -582,16 +804,26 @@ class SchedulingApp(QMainWindow):
         y_min = self.employee_ruler.get_value_at(0)
         y_max = self.employee_ruler.get_value_at(viewport_rect.height())
 
-        for item in self.interaction.items:
-            if not (item.x > x_max or
-                   item.x + item.width < x_min or
-                   item.y > y_max or
-                   item.y + item.height < y_min):
-                visible_items += 1
+        # One vectorized bounds test over the rows kept up to date on add/drop
+        n = len(self._item_rows)
+        x_min_us = (x_min - self.start_date) // _MICROSECOND
+        x_max_us = (x_max - self.start_date) // _MICROSECOND
+        visible_items = int(np.count_nonzero(
+            (self._items_ends_us[:n] >= x_min_us) &
+            (self._items_starts_us[:n] <= x_max_us) &
+            (self._items_ymax[:n] >= y_min) &
+            (self._items_ymin[:n] <= y_max)
+        ))
 
         total_items = len(self.interaction.items)
         visible_employees = int(y_max - y_min)
 
+        # A viewport change doesn't necessarily change the numbers shown
+        stats = (visible_employees, visible_items, total_items)
+        if stats == self._last_stats:
+            return
+        self._last_stats = stats
+
         self.setWindowTitle(
             f"Enterprise Scheduling - {self.num_employees} Employees | "
             f"Viewing: {visible_employees} employees | "
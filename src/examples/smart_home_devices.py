@@ -1,10 +1,13 @@
 import json
+import math
 import sys
+from collections import defaultdict
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Type
+from typing import Dict, Iterator, List, Optional, Set, Tuple, Type
 
+import numpy as np
 from PySide6.QtCore import QEvent, QPointF, Qt, QTimer, QObject
-from PySide6.QtGui import QBrush, QColor, QPainter, QPen, QRadialGradient
+from PySide6.QtGui import QBrush, QColor, QPainter, QPen, QPixmap, QRadialGradient
 from PySide6.QtWidgets import (
     QApplication,
     QComboBox,
@@ -27,6 +30,26 @@ from sprintify.navigation.navigation_widget import NavigationWidget
 from sprintify.navigation.rulers import NumberRuler
 
 
+# Palette colours are resolved once; items share these instances, so never mutate them
+_BULB_ON_FILL = QColor(colors["amber"][400])
+_BULB_ON_STROKE = QColor(colors["amber"][600])
+_BULB_GLOW = QColor(255, 238, 88, 120)
+_BULB_OFF_FILL = QColor(colors["grey"][200])
+_BULB_OFF_STROKE = QColor(colors["grey"][500])
+_BULB_LABEL = QColor(colors["grey"][900])
+_SWITCH_ON_FILL = QColor(colors["green"][400])
+_SWITCH_ON_STROKE = QColor(colors["green"][700])
+_SWITCH_OFF_FILL = QColor(colors["red"][400])
+_SWITCH_OFF_STROKE = QColor(colors["red"][700])
+_SWITCH_LABEL = QColor(colors["grey"][50])
+_KNOB_COLOR = QColor(colors["grey"][50])
+_THERMOSTAT_FILL = QColor(colors["blue_grey"][100])
+_THERMOSTAT_STROKE = QColor(colors["blue_grey"][600])
+_THERMOSTAT_LABEL = QColor(colors["blue_grey"][700])
+_CONNECTION_COLOR = QColor(colors["grey"][400])
+_DRAG_LINE_COLOR = QColor(colors["blue"][500])
+
+
 # --- Device Classes ---
 
 class SmartDevice:
@@ -88,7 +111,7 @@ class Bulb(SmartDevice):
     def create_item(self, mode: str) -> InteractiveItem:
         item = super().create_item(mode)
         item.visuals.shape = ItemShape.ELLIPSE
-        item.visuals.label_color = QColor(colors["grey"][900])
+        item.visuals.label_color = _BULB_LABEL
         # Set initial visuals
         self.update_item_visuals(item)
         return item
@@ -96,13 +119,13 @@ class Bulb(SmartDevice):
     def update_item_visuals(self, item: InteractiveItem) -> None:
         """Update visuals based on bulb state."""
         if self.state:
-            item.visuals.fill_color = QColor(colors["amber"][400])
-            item.visuals.stroke_color = QColor(colors["amber"][600])
-            item.visuals.glow_color = QColor(255, 238, 88, 120)
+            item.visuals.fill_color = _BULB_ON_FILL
+            item.visuals.stroke_color = _BULB_ON_STROKE
+            item.visuals.glow_color = _BULB_GLOW
             item.visuals.glow_radius = 0.75
         else:
-            item.visuals.fill_color = QColor(colors["grey"][200])
-            item.visuals.stroke_color = QColor(colors["grey"][500])
+            item.visuals.fill_color = _BULB_OFF_FILL
+            item.visuals.stroke_color = _BULB_OFF_STROKE
             item.visuals.glow_color = None
             item.visuals.glow_radius = 0.0
 
@@ -124,7 +147,7 @@ class Switch(SmartDevice):
         item = super().create_item(mode)
         item.visuals.shape = ItemShape.ROUNDED_RECT
         item.visuals.corner_radius = 5
-        item.visuals.label_color = QColor(colors["grey"][50])
+        item.visuals.label_color = _SWITCH_LABEL
         # Set initial visuals
         self.update_item_visuals(item)
         return item
@@ -132,11 +155,11 @@ class Switch(SmartDevice):
     def update_item_visuals(self, item: InteractiveItem) -> None:
         """Update visuals based on switch state."""
         if self.state:
-            item.visuals.fill_color = QColor(colors["green"][400])
-            item.visuals.stroke_color = QColor(colors["green"][700])
+            item.visuals.fill_color = _SWITCH_ON_FILL
+            item.visuals.stroke_color = _SWITCH_ON_STROKE
         else:
-            item.visuals.fill_color = QColor(colors["red"][400])
-            item.visuals.stroke_color = QColor(colors["red"][700])
+            item.visuals.fill_color = _SWITCH_OFF_FILL
+            item.visuals.stroke_color = _SWITCH_OFF_STROKE
 
 
 class Thermostat(SmartDevice):
@@ -166,9 +189,9 @@ class Thermostat(SmartDevice):
         item = super().create_item(mode)
         item.visuals.shape = ItemShape.ROUNDED_RECT
         item.visuals.corner_radius = 8
-        item.visuals.fill_color = QColor(colors["blue_grey"][100])
-        item.visuals.stroke_color = QColor(colors["blue_grey"][600])
-        item.visuals.label_color = QColor(colors["blue_grey"][700])
+        item.visuals.fill_color = _THERMOSTAT_FILL
+        item.visuals.stroke_color = _THERMOSTAT_STROKE
+        item.visuals.label_color = _THERMOSTAT_LABEL
         # Set initial label
         self.update_item_visuals(item)
         return item
@@ -194,8 +217,51 @@ class DeviceHandler(QObject):
         self.mode = "operate"
         self.connect_src: Optional[str] = None
         self.connect_pt: Optional[QPointF] = None
+        # Each connection stored once as an ordered (low_id, high_id) pair; device
+        # connected_to sets are only filled in for loading and saving
+        self._edges: Set[Tuple[str, str]] = set()
         self.next_ids = {k: 1 for k in self.DEVICE_TYPES}
 
+        # Painting resources reused across redraws
+        self._conn_pen = QPen(_CONNECTION_COLOR, 2, Qt.PenStyle.DashLine)
+        self._drag_pen = QPen(_DRAG_LINE_COLOR, 2)
+        self._knob_brush = QBrush(_KNOB_COLOR)
+        # Pre-rendered knobs keyed by (pixel radius, device pixel ratio)
+        self._knob_pix_cache: Dict[Tuple[int, float], QPixmap] = {}
+
+        # Unit-cell grid over device bounds, used to pick items under the cursor
+        self._spatial: Dict[Tuple[int, int], List[InteractiveItem]] = defaultdict(list)
+
+        # Device id -> its InteractiveItem, replacing linear find_item_by_data scans
+        self._items_by_uid: Dict[str, InteractiveItem] = {}
+        # Switch items only, so the knob overlay skips unrelated devices
+        self._switch_items: List[InteractiveItem] = []
+        # Union (x0, y0, x1, y1) of switch bounds, None until recomputed
+        self._switch_bbox: Optional[Tuple[float, float, float, float]] = None
+        # Set while items are being dragged, when they move without updating the box
+        self._dragging = False
+        # Ids of thermostats still moving towards their target; the physics
+        # timer only runs while this is non-empty
+        self._active_thermostats: Set[str] = set()
+
+        # Visible data bounds (x_min, x_max, y_min, y_max) and the view key they were computed for
+        self._bounds_key = None
+        self._cached_bounds: Optional[Tuple[float, float, float, float]] = None
+
+        # Device geometry as (x, y, w, h) rows, updated in place as devices are
+        # added, moved or removed; rows are kept dense by swapping in the last one
+        self._coords = np.zeros((16, 4))
+        self._uid_to_row: Dict[str, int] = {}
+        self._row_uids: List[str] = []
+        # (M, 2) row pairs per connection, rebuilt lazily after edges or rows change
+        self._pairs_dirty = True
+        self._pairs = np.empty((0, 2), dtype=np.intp)
+
+        # Connection lines memoised on (connection version, visible bounds)
+        self._conn_version = 0
+        self._lines_key = None
+        self._lines_cache: List[list] = []
+
         # Initialize core interaction handler
         self.interaction = InteractionHandler(
             self.widget.canvas,
@@ -205,6 +271,7 @@ class DeviceHandler(QObject):
 
         # Configure interaction
         self.interaction.on_drop = self._on_devices_dropped
+        self.interaction.on_drag_update = self._on_drag_update
 
         # Custom draw only for additional features (switch knobs)
         # Remove custom drawing - let standard drawing handle everything
@@ -214,7 +281,16 @@ class DeviceHandler(QObject):
         self.widget.canvas.viewport().installEventFilter(self)
 
         self.timer = QTimer(timeout=self._simulate_physics)
-        self.timer.start(1000)
+        self.timer.setInterval(1000)
+
+        # Collapses bursts of mouse moves into one redraw per event-loop pass
+        self._redraw_timer = QTimer(self)
+        self._redraw_timer.setSingleShot(True)
+        self._redraw_timer.setInterval(0)
+        self._redraw_timer.timeout.connect(self._update_drag_line)
+
+        # Connection lines are registered once and recomputed only when stale
+        self.widget.draw_lines("conn", self._connection_lines, pen=self._conn_pen)
 
         # Add overlay drawing for switch knobs
         self.widget.canvas.add_draw_command("__overlay__switch_knobs", self._draw_switch_knobs)
@@ -233,42 +309,58 @@ class DeviceHandler(QObject):
         # Create interactive item with visual properties
         item = dev.create_item(self.mode)
         self.interaction.add_item(item)
-        self.update_drawings()
+        self._index_item(item)
+        self._track_item(item)
+        self._update_connections()
 
     def remove_device(self, uid: str):
         if uid in self.devices:
-            dev = self.devices[uid]
-            item = self.interaction.find_item_by_data(dev)
+            item = self._items_by_uid.get(uid)
             if item:
                 self.interaction.remove_item(item)
+                self._unindex_item(item)
+                self._untrack_item(item)
 
             del self.devices[uid]
-            for d in self.devices.values():
-                d.connected_to.discard(uid)
+            self._edges = {e for e in self._edges if uid not in e}
 
             # Ensure overlay is redrawn
             self.widget.canvas.viewport().update()
-            self.update_drawings()
+            self._pairs_dirty = True
+            self._update_connections()
 
     def _draw_switch_knobs(self, painter: QPainter):
         """Draw switch knobs as an overlay on top of standard switch rendering."""
         if not self.interaction.xr or not self.interaction.yr:
             return
 
+        if not self._switch_items:
+            return
+
         # Get visible bounds for culling
-        viewport_rect = self.widget.canvas.viewport().rect()
-        visible_x_min = self.interaction.xr.get_value_at(0)
-        visible_x_max = self.interaction.xr.get_value_at(viewport_rect.width())
-        visible_y_min = self.interaction.yr.get_value_at(0)
-        visible_y_max = self.interaction.yr.get_value_at(viewport_rect.height())
+        visible_x_min, visible_x_max, visible_y_min, visible_y_max = self._get_visible_bounds()
+
+        # Skip everything when no switch can be in view; dragged items move
+        # without updating the box, so only trust it between drags
+        if not self._dragging:
+            if self._switch_bbox is None:
+                items = self._switch_items
+                self._switch_bbox = (
+                    min(i.x for i in items),
+                    min(i.y for i in items),
+                    max(i.x + i.width for i in items),
+                    max(i.y + i.height for i in items),
+                )
+            x0, y0, x1, y1 = self._switch_bbox
+            if x0 > visible_x_max or x1 < visible_x_min or y0 > visible_y_max or y1 < visible_y_min:
+                return
 
-        for item in self.interaction.items:
+        dpr = painter.device().devicePixelRatioF()
+
+        for item in self._switch_items:
             dev = item.data
 
             # Only process switches that are visible
-            if not isinstance(dev, Switch):
-                continue
-
             if (item.x > visible_x_max or
                 item.x + item.width < visible_x_min or
                 item.y > visible_y_max or
@@ -279,20 +371,99 @@ class DeviceHandler(QObject):
             rect = item.get_interaction_rect_px(self.interaction.xr, self.interaction.yr)
 
             # Draw switch knob
-            painter.setBrush(QBrush(QColor(colors["grey"][50])))
-            painter.setPen(Qt.PenStyle.NoPen)
+            r = round(rect.width() * 0.12)
+            if r < 1:
+                continue
             offset = 1 if dev.state else -1
             cx = rect.center().x() + (rect.width() * 0.3 * offset)
-            radius = rect.width() * 0.12
-            painter.drawEllipse(QPointF(cx, rect.center().y()), radius, radius)
+            painter.drawPixmap(QPointF(cx - r, rect.center().y() - r), self._knob_pixmap(r, dpr))
+
+    def _knob_pixmap(self, r: int, dpr: float) -> QPixmap:
+        """Antialiased knob of radius r, rasterised once per size."""
+        key = (r, dpr)
+        pix = self._knob_pix_cache.get(key)
+        if pix is None:
+            size = 2 * r
+            pix = QPixmap(round(size * dpr), round(size * dpr))
+            pix.setDevicePixelRatio(dpr)
+            pix.fill(Qt.GlobalColor.transparent)
+            p = QPainter(pix)
+            p.setRenderHint(QPainter.RenderHint.Antialiasing)
+            p.setBrush(self._knob_brush)
+            p.setPen(Qt.PenStyle.NoPen)
+            p.drawEllipse(0, 0, size, size)
+            p.end()
+            self._knob_pix_cache[key] = pix
+        return pix
+
+    def _on_drag_update(self, item: InteractiveItem):
+        """Note that a drag is moving items; positions are left as they are."""
+        self._dragging = True
+        return None
 
     def _on_devices_dropped(self, items: List[InteractiveItem]):
         """Sync new coordinates back to SmartDevice objects after drag."""
         for item in items:
+            # Still indexed under its pre-drag position, kept in its geometry row
+            self._unindex_item(item)
             dev = item.data
             dev.x = item.x
             dev.y = item.y
-        self.update_drawings()
+            self._index_item(item)
+            self._store_coords(dev)
+        self._switch_bbox = None
+        self._update_connections()
+
+    @staticmethod
+    def _cells(x: float, y: float, w: float, h: float) -> Iterator[Tuple[int, int]]:
+        """Grid cells overlapped by the given bounds (edges inclusive, like contains)."""
+        for cx in range(math.floor(x), math.floor(x + w) + 1):
+            for cy in range(math.floor(y), math.floor(y + h) + 1):
+                yield cx, cy
+
+    def _index_item(self, item: InteractiveItem):
+        dev = item.data
+        for cell in self._cells(dev.x, dev.y, dev.width, dev.height):
+            self._spatial[cell].append(item)
+
+    def _unindex_item(self, item: InteractiveItem):
+        """Remove item from the grid cells of the position last stored in _coords."""
+        x, y, w, h = self._coords[self._uid_to_row[item.data.id]].tolist()
+        for cell in self._cells(x, y, w, h):
+            bucket = self._spatial.get(cell)
+            if bucket and item in bucket:
+                bucket.remove(item)
+                if not bucket:
+                    del self._spatial[cell]
+
+    def _track_item(self, item: InteractiveItem):
+        dev = item.data
+        self._items_by_uid[dev.id] = item
+        self._store_coords(dev)
+        if isinstance(dev, Thermostat):
+            self._wake_thermostat(dev)
+        elif isinstance(dev, Switch):
+            self._switch_items.append(item)
+            self._switch_bbox = None
+
+    def _untrack_item(self, item: InteractiveItem):
+        dev = item.data
+        del self._items_by_uid[dev.id]
+        self._drop_coords(dev.id)
+        if isinstance(dev, Thermostat):
+            self._active_thermostats.discard(dev.id)
+        elif isinstance(dev, Switch):
+            self._switch_items.remove(item)
+            self._switch_bbox = None
+
+    def _pick(self, x: float, y: float) -> Optional[InteractiveItem]:
+        """Return the first item containing (x, y), probing only its grid cell."""
+        bucket = self._spatial.get((math.floor(x), math.floor(y)))
+        if bucket:
+            for item in bucket:
+                if item.contains(x, y):
+                    return item
+        return None
 
     def set_mode(self, mode: str):
         self.mode = mode
@@ -308,27 +479,46 @@ class DeviceHandler(QObject):
 
     def _simulate_physics(self):
         updated = False
-        for d in self.devices.values():
-            if isinstance(d, Thermostat):
-                diff = d.target - d.curr
-                if abs(diff) > 0.1:
-                    change = 0.3 if diff > 0 else -0.3
-                    d.curr += change if abs(diff) > 0.3 else diff
-                    # Update the item's visual when temperature changes
-                    item = self.interaction.find_item_by_data(d)
-                    if item:
-                        d.update_item_visuals(item)
-                    updated = True
+        settled = []
+        for uid in self._active_thermostats:
+            d = self.devices[uid]
+            diff = d.target - d.curr
+            if abs(diff) > 0.1:
+                change = 0.3 if diff > 0 else -0.3
+                d.curr += change if abs(diff) > 0.3 else diff
+                # Update the item's visual when temperature changes
+                d.update_item_visuals(self._items_by_uid[uid])
+                updated = True
+            if abs(d.target - d.curr) <= 0.1:
+                settled.append(uid)
+
+        self._active_thermostats.difference_update(settled)
+        if not self._active_thermostats:
+            self.timer.stop()
 
         if updated:
             self.widget.update()
 
+    def _wake_thermostat(self, dev: Thermostat):
+        """Start simulating dev if it is off target, restarting the idle timer."""
+        if abs(dev.target - dev.curr) > 0.1:
+            self._active_thermostats.add(dev.id)
+            if not self.timer.isActive():
+                self.timer.start()
+
     def eventFilter(self, source, event):
         if source != self.widget.canvas.viewport():
             return super().eventFilter(source, event)
 
         evt_type = event.type()
 
+        if evt_type == QEvent.Type.MouseButtonRelease and self._dragging:
+            # This filter was installed after the interaction handler's, so it sees
+            # the release first; whether the items are then dropped or restored,
+            # the switch box has to be recomputed from their final positions
+            self._dragging = False
+            self._switch_bbox = None
+
         # Let core handle most mouse events, we only intercept specific cases
         if evt_type == QEvent.Type.MouseButtonPress:
             pos = event.position()
@@ -337,16 +527,16 @@ class DeviceHandler(QObject):
 
             # Right-click for connections (Edit mode)
             if event.button() == Qt.MouseButton.RightButton and self.mode == "edit":
-                item = next((i for i in self.interaction.items if i.contains(x, y)), None)
+                item = self._pick(x, y)
                 if item and not isinstance(item.data, Thermostat):
                     self.connect_src = item.data.id
                     self.connect_pt = pos
-                    self.update_drawings()  # Update drag line immediately
+                    self._update_drag_line()  # Show drag line immediately
                     return True
 
             # Left-click for operate mode
             elif event.button() == Qt.MouseButton.LeftButton and self.mode == "operate":
-                item = next((i for i in self.interaction.items if i.contains(x, y)), None)
+                item = self._pick(x, y)
                 if item:
                     dev = item.data
                     if isinstance(dev, (Switch, Bulb)):
@@ -360,7 +550,7 @@ class DeviceHandler(QObject):
 
         elif evt_type == QEvent.Type.MouseMove and self.connect_src:
             self.connect_pt = event.position()
-            self.update_drawings()  # Update drag line as it moves
+            self._schedule_drag_line()  # Update drag line as it moves
             return True
 
         elif evt_type == QEvent.Type.MouseButtonRelease and self.connect_src:
@@ -368,13 +558,13 @@ class DeviceHandler(QObject):
             x = self.widget.top_ruler.get_value_at(pos.x())
             y = self.widget.left_ruler.get_value_at(pos.y())
 
-            target_item = next((i for i in self.interaction.items if i.contains(x, y)), None)
+            target_item = self._pick(x, y)
             if target_item and target_item.data.id != self.connect_src:
                 self._finish_connection(target_item.data.id)
 
             self.connect_src = None
             self.connect_pt = None
-            self.update_drawings()  # Clear drag line
+            self._update_drag_line()  # Clear drag line
             return True
 
         elif evt_type == QEvent.Type.MouseButtonDblClick:
@@ -382,7 +572,7 @@ class DeviceHandler(QObject):
             x = self.widget.top_ruler.get_value_at(pos.x())
             y = self.widget.left_ruler.get_value_at(pos.y())
 
-            item = next((i for i in self.interaction.items if i.contains(x, y)), None)
+            item = self._pick(x, y)
             if item and isinstance(item.data, Thermostat):
                 dev = item.data
                 val, ok = QInputDialog.getDouble(
@@ -390,6 +580,7 @@ class DeviceHandler(QObject):
                 )
                 if ok:
                     dev.target = val
+                    self._wake_thermostat(dev)
                     # Update visuals after target change
                     dev.update_item_visuals(item)
                     self.widget.update()
@@ -405,73 +596,134 @@ class DeviceHandler(QObject):
 
         return super().eventFilter(source, event)
 
+    @staticmethod
+    def _edge(a: str, b: str) -> Tuple[str, str]:
+        return (a, b) if a < b else (b, a)
+
+    def connect(self, a: str, b: str):
+        """Connect two devices (no-op if already connected)."""
+        self._edges.add(self._edge(a, b))
+        self._pairs_dirty = True
+
     def _finish_connection(self, target_id: str):
         src = self.devices[self.connect_src]
-        dst = self.devices[target_id]
 
-        if target_id in src.connected_to:
-            src.connected_to.discard(target_id)
-            dst.connected_to.discard(self.connect_src)
-        else:
-            src.connected_to.add(target_id)
-            dst.connected_to.add(self.connect_src)
+        # Toggle: connecting an already connected pair disconnects it
+        self._edges ^= {self._edge(self.connect_src, target_id)}
 
         if isinstance(src, Switch):
             self._sync_switch(src)
 
-        self.update_drawings()  # Update connection lines
+        self._pairs_dirty = True
+        self._update_connections()
 
     def _sync_switch(self, switch: Switch):
-        for uid in switch.connected_to:
-            dev = self.devices.get(uid)
+        sid = switch.id
+        for a, b in self._edges:
+            if sid != a and sid != b:
+                continue
+            dev = self.devices.get(b if a == sid else a)
             if isinstance(dev, Bulb):
                 dev.state = switch.state
                 # Update bulb visual when synced with switch
-                item = self.interaction.find_item_by_data(dev)
-                if item:
-                    dev.update_item_visuals(item)
+                dev.update_item_visuals(self._items_by_uid[dev.id])
 
-    def update_drawings(self):
-        # Connection lines
-        self.widget.remove_draw_command("conn")
-
-        # Get visible bounds for culling
+    def _get_visible_bounds(self) -> Tuple[float, float, float, float]:
+        """Visible data bounds, recomputed only after a scroll, zoom or resize."""
+        xr, yr = self.widget.top_ruler, self.widget.left_ruler
         viewport_rect = self.widget.canvas.viewport().rect()
-        x_min = self.widget.top_ruler.get_value_at(0)
-        x_max = self.widget.top_ruler.get_value_at(viewport_rect.width())
-        y_min = self.widget.left_ruler.get_value_at(0)
-        y_max = self.widget.left_ruler.get_value_at(viewport_rect.height())
-
-        lines = []
-        for src_id, src_dev in self.devices.items():
-            # Skip if source device is not visible
-            if (src_dev.x > x_max or src_dev.x + src_dev.width < x_min or
-                src_dev.y > y_max or src_dev.y + src_dev.height < y_min):
-                continue
-
-            for dst_id in src_dev.connected_to:
-                if src_id < dst_id and dst_id in self.devices:
-                    dst_dev = self.devices[dst_id]
-                    # Skip if destination is also not visible
-                    if (dst_dev.x > x_max or dst_dev.x + dst_dev.width < x_min or
-                        dst_dev.y > y_max or dst_dev.y + dst_dev.height < y_min):
-                        continue
-
-                    lines.append((
-                        src_dev.x + src_dev.width / 2,
-                        src_dev.y + src_dev.height / 2,
-                        dst_dev.x + dst_dev.width / 2,
-                        dst_dev.y + dst_dev.height / 2
-                    ))
-
-        if lines:
-            self.widget.draw_lines(
-                "conn",
-                lambda: lines,
-                pen=QPen(QColor(colors["grey"][400]), 2, Qt.PenStyle.DashLine),
+        # The rulers don't emit change signals, so detect scroll/zoom/resize by key
+        key = (
+            xr.visible_start, xr.visible_stop, yr.visible_start, yr.visible_stop,
+            viewport_rect.width(), viewport_rect.height(),
+        )
+        if key != self._bounds_key:
+            self._bounds_key = key
+            self._cached_bounds = (
+                xr.get_value_at(0),
+                xr.get_value_at(viewport_rect.width()),
+                yr.get_value_at(0),
+                yr.get_value_at(viewport_rect.height()),
             )
+        return self._cached_bounds
+
+    def _schedule_drag_line(self):
+        """Request _update_drag_line() on the next event-loop pass; repeated calls coalesce."""
+        self._redraw_timer.start()
 
-        # Drag line for connections
+    def update_drawings(self):
+        # Callers may have edited device positions directly; move their items,
+        # grid cells and geometry rows along, as a drop does
+        self._switch_bbox = None
+        for uid, item in self._items_by_uid.items():
+            dev = item.data
+            x, y = self._coords[self._uid_to_row[uid], :2].tolist()
+            if x != dev.x or y != dev.y:
+                self._unindex_item(item)
+                item.x = dev.x
+                item.y = dev.y
+                self._store_coords(dev)
+                self._index_item(item)
+        self._update_connections()
+        self._update_drag_line()
+
+    def _store_coords(self, dev: SmartDevice):
+        """Write dev's bounds into its row of the geometry array, growing it if needed."""
+        row = self._uid_to_row.get(dev.id)
+        if row is None:
+            row = len(self._row_uids)
+            self._uid_to_row[dev.id] = row
+            self._row_uids.append(dev.id)
+            if row == len(self._coords):
+                self._coords = np.concatenate([self._coords, np.zeros_like(self._coords)])
+        self._coords[row] = (dev.x, dev.y, dev.width, dev.height)
+
+    def _drop_coords(self, uid: str):
+        """Free uid's row by moving the last row into it."""
+        row = self._uid_to_row.pop(uid)
+        last_uid = self._row_uids.pop()
+        if last_uid != uid:
+            self._coords[row] = self._coords[len(self._row_uids)]
+            self._row_uids[row] = last_uid
+            self._uid_to_row[last_uid] = row
+        self._pairs_dirty = True
+
+    def _rebuild_pairs(self):
+        rows = self._uid_to_row
+        pairs = [(rows[a], rows[b]) for a, b in self._edges]
+        self._pairs = np.array(pairs, dtype=np.intp).reshape(-1, 2)
+        self._pairs_dirty = False
+
+    def _update_connections(self):
+        """Invalidate connection lines; call when devices or connections change."""
+        self._conn_version += 1
+        self.widget.canvas.viewport().update()
+
+    def _connection_lines(self) -> List[list]:
+        # Get visible bounds for culling
+        bounds = self._get_visible_bounds()
+        key = (self._conn_version, bounds)
+        if key == self._lines_key:
+            return self._lines_cache
+        x_min, x_max, y_min, y_max = bounds
+
+        if self._pairs_dirty:
+            self._rebuild_pairs()
+
+        x, y, w, h = self._coords[:len(self._row_uids)].T
+        src, dst = self._pairs[:, 0], self._pairs[:, 1]
+
+        # Draw a connection only when both ends are visible
+        visible = np.logical_and.reduce((x <= x_max, x + w >= x_min, y <= y_max, y + h >= y_min))
+        mask = visible[src] & visible[dst]
+        cx = x + w / 2
+        cy = y + h / 2
+        self._lines_cache = np.column_stack((cx[src], cy[src], cx[dst], cy[dst]))[mask].tolist()
+        self._lines_key = key
+        return self._lines_cache
+
+    def _update_drag_line(self):
+        """Redraw only the in-progress connection line."""
         self.widget.remove_draw_command("drag_line")
         if self.connect_src and self.connect_pt:
             src = self.devices[self.connect_src]
@@ -480,10 +732,15 @@ class DeviceHandler(QObject):
             self.widget.draw_lines(
                 "drag_line",
                 lambda: [(src.x + src.width / 2, src.y + src.height / 2, ex, ey)],
-                pen=QPen(QColor(colors["blue"][500]), 2),
+                pen=self._drag_pen,
             )
 
     def to_json(self) -> dict:
+        for dev in self.devices.values():
+            dev.connected_to = set()
+        for a, b in self._edges:
+            self.devices[a].connected_to.add(b)
+            self.devices[b].connected_to.add(a)
         return {
             "devices": {uid: dev.to_dict() for uid, dev in self.devices.items()},
             "next_ids": self.next_ids,
@@ -492,6 +749,14 @@ class DeviceHandler(QObject):
     def from_json(self, data: dict):
         self.devices.clear()
         self.interaction.clear_items()
+        self._spatial.clear()
+        self._items_by_uid.clear()
+        self._uid_to_row.clear()
+        self._row_uids.clear()
+        self._active_thermostats.clear()
+        self._switch_items.clear()
+        self._switch_bbox = None
+        self._edges.clear()
 
         dev_map = data.get("devices", {})
 
@@ -508,16 +773,20 @@ class DeviceHandler(QObject):
                     # Create item with visual properties
                     item = dev.create_item(self.mode)
                     self.interaction.add_item(item)
+                    self._index_item(item)
+                    self._track_item(item)
                 except TypeError:
                     continue
 
         # Restore connections
-        valid_ids = set(self.devices.keys())
-        for dev in self.devices.values():
-            dev.connected_to &= valid_ids
+        for uid, dev in self.devices.items():
+            for other in dev.connected_to:
+                if other in self.devices and other != uid:
+                    self._edges.add(self._edge(uid, other))
 
         self.next_ids = data.get("next_ids", self.next_ids)
-        self.update_drawings()
+        self._pairs_dirty = True
+        self._update_connections()
         self.widget.update()
 
 
@@ -608,8 +877,9 @@ class SmartHomeWindow(QMainWindow):
 
         try:
             data = {"bg": self.bg_image, "home": self.handler.to_json()}
+            # Compact separators; indenting dominates write time for large homes
             with open(path, "w") as f:
-                json.dump(data, f, indent=2)
+                json.dump(data, f, separators=(",", ":"))
         except Exception as e:
             QMessageBox.critical(self, "Save Error", str(e))
 
@@ -648,12 +918,9 @@ class SmartHomeWindow(QMainWindow):
         self.handler.add_device("switch", 12, 7)
 
         if "S1" in self.handler.devices:
-            s1 = self.handler.devices["S1"]
-            s1.connected_to = {"B1", "B2"}
-            if "B1" in self.handler.devices:
-                self.handler.devices["B1"].connected_to.add("S1")
-            if "B2" in self.handler.devices:
-                self.handler.devices["B2"].connected_to.add("S1")
+            for uid in ("B1", "B2"):
+                if uid in self.handler.devices:
+                    self.handler.connect("S1", uid)
 
         # Ensure devices are visible
         self.handler.update_drawings()
@@ -248,15 +248,18 @@ class InteractiveItem(Generic[T]):
         x2 = xr.transform(self.x + self.width)
         y1 = yr.transform(self.y)
         y2 = yr.transform(self.y + self.height)
-        rect = QRectF(x1, y1, x2 - x1, y2 - y1).normalized()
+
+        # Normalize and apply the interaction ratios in plain floats so that only
+        # one QRectF is constructed per call
+        if x2 < x1:
+            x1, x2 = x2, x1
+        if y2 < y1:
+            y1, y2 = y2, y1
+        w = x2 - x1
+        h = y2 - y1
 
         if not self.interaction_rect:
-            return rect
+            return QRectF(x1, y1, w, h)
 
         px1, py1, px2, py2 = self.interaction_rect
-        return QRectF(
-            rect.x() + rect.width() * px1,
-            rect.y() + rect.height() * py1,
-            rect.width() * (px2 - px1),
-            rect.height() * (py2 - py1),
-        )
+        return QRectF(x1 + w * px1, y1 + h * py1, w * (px2 - px1), h * (py2 - py1))
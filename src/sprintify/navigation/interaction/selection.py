@@ -1,6 +1,6 @@
 from dataclasses import dataclass, field
 from datetime import timedelta
-from typing import Callable, Generic, List, Optional, Set, Tuple, TypeVar, Union
+from typing import Any, Callable, Dict, Generic, Iterable, List, Optional, Set, Tuple, TypeVar, Union
 from contextlib import contextmanager
 
 from PySide6.QtCore import QEvent, QPointF, QRectF, Qt, QObject
@@ -11,6 +11,10 @@ from .interaction_item import InteractiveItem, ResizeHandle, ItemShape
 
 T = TypeVar("T")
 
+# Upper bound on cached brushes/pens; item colors normally come from a small palette
+_STYLE_CACHE_SIZE = 256
+_LABEL_COLOR = QColor(Qt.GlobalColor.white)
+
 
 @dataclass
 class SelectionManager(Generic[T]):
@@ -401,10 +405,19 @@ class InteractionHandler(QObject, Generic[T]):
 
         # Global visual strategies (fallbacks when item doesn't specify)
         self.item_corner_radius: float = 4
+        # Set False to fill batched plain rectangles without antialiasing, which is
+        # faster but snaps fractional edges and thin strokes to the pixel grid
+        self.antialias_plain_rects: bool = True
         self.get_item_color: Optional[Callable[[InteractiveItem[T]], QColor]] = None
         self.get_item_label: Optional[Callable[[InteractiveItem[T]], str]] = None
         self.get_item_tooltip: Optional[Callable[[InteractiveItem[T]], str]] = None
 
+        # Spatial query (x_min, x_max, y_min, y_max) -> candidate items in that data range.
+        # When set, drawing asks it for candidates instead of scanning all items.
+        self.get_visible_items: Optional[
+            Callable[[Any, Any, float, float], Iterable[InteractiveItem[T]]]
+        ] = None
+
         # Custom drawing (replaces standard drawing)
         self.draw_custom_item: Optional[
             Callable[[QPainter, InteractiveItem[T], QRectF], None]
@@ -412,6 +425,10 @@ class InteractionHandler(QObject, Generic[T]):
 
         self.show_tooltips: bool = True
 
+        # Brushes and pens reused across frames, keyed by color (and pen width)
+        self._brush_cache: Dict[int, QBrush] = {}
+        self._pen_cache: Dict[Tuple[int, float], QPen] = {}
+
         if canvas_widget and hasattr(canvas_widget, "add_draw_command"):
             canvas_widget.add_draw_command("interaction_items", self._draw_items)
             canvas_widget.add_draw_command("__overlay__interaction", self._draw_overlay)
@@ -634,6 +651,12 @@ class InteractionHandler(QObject, Generic[T]):
                 return item
         return None
 
+    def _items_in(self, x_min, x_max, y_min, y_max) -> Iterable[InteractiveItem[T]]:
+        """Candidate items for a data range; all items unless get_visible_items is set."""
+        if self.get_visible_items:
+            return self.get_visible_items(x_min, x_max, y_min, y_max)
+        return self.items
+
     # --- Internal Drawing Methods ---
 
     def _draw_items(self, p: QPainter) -> None:
@@ -649,8 +672,15 @@ class InteractionHandler(QObject, Generic[T]):
 
         dragged_set = set(self._drag_drop.dragged_items) if self._drag_drop.dragging else set()
 
+        # Consecutive plain rectangles sharing a style are drawn with one drawRects
+        # call. A run ends at the first item that differs, so items still paint in
+        # list order; only the labels of a run follow all of its rectangles.
+        run_key = None
+        run_style: Optional[Tuple[QColor, Optional[QColor], float]] = None
+        run: List[Tuple[InteractiveItem[T], QRectF]] = []
+
         # Only process items that are potentially visible
-        for item in self.items:
+        for item in self._items_in(visible_x_min, visible_x_max, visible_y_min, visible_y_max):
             if item in dragged_set:
                 continue
 
@@ -667,11 +697,87 @@ class InteractionHandler(QObject, Generic[T]):
             # Check if hover or selected for highlight
             highlighted = (self._hover_item == item) or item.selected
 
+            if not self.draw_custom_item and not highlighted and self._is_plain_rect(item):
+                visuals = item.visuals
+                fill = self._item_fill(item)
+                setattr(item, "_cached_brush_color", fill)
+                stroke = visuals.stroke_color
+                key = (fill.rgba(), stroke.rgba() if stroke else None, visuals.stroke_width)
+                if key != run_key:
+                    self._draw_rect_run(p, run_style, run)
+                    run = []
+                    run_key = key
+                    run_style = (fill, stroke, visuals.stroke_width)
+                run.append((item, rect))
+                continue
+
+            self._draw_rect_run(p, run_style, run)
+            run = []
+            run_key = None
             if self.draw_custom_item:
                 self.draw_custom_item(p, item, rect)
             else:
                 self._draw_standard_item(p, item, rect, highlighted)
 
+        self._draw_rect_run(p, run_style, run)
+
+    def _draw_rect_run(self, p: QPainter, style: Tuple[QColor, Optional[QColor], float],
+                       run: List[Tuple[InteractiveItem[T], QRectF]]) -> None:
+        """Draw a run of plain rectangles sharing one (fill, stroke, width) style, then their labels."""
+        if not run:
+            return
+        fill, stroke, stroke_width = style
+        p.setBrush(self._brush(fill))
+        if stroke:
+            p.setPen(self._pen(stroke, stroke_width))
+        else:
+            p.setPen(Qt.PenStyle.NoPen)
+        rects = [rect for _, rect in run]
+        if self.antialias_plain_rects:
+            p.drawRects(rects)
+        else:
+            antialiased = p.testRenderHint(QPainter.RenderHint.Antialiasing)
+            p.setRenderHint(QPainter.RenderHint.Antialiasing, False)
+            p.drawRects(rects)
+            p.setRenderHint(QPainter.RenderHint.Antialiasing, antialiased)
+        for item, rect in run:
+            self._draw_item_label(p, item, rect)
+
+    def _brush(self, color: QColor) -> QBrush:
+        """Cached solid brush for color."""
+        key = color.rgba()
+        brush = self._brush_cache.get(key)
+        if brush is None:
+            if len(self._brush_cache) >= _STYLE_CACHE_SIZE:
+                self._brush_cache.clear()
+            brush = self._brush_cache[key] = QBrush(QColor(color))
+        return brush
+
+    def _pen(self, color: QColor, width: float) -> QPen:
+        """Cached solid pen for color and width."""
+        key = (color.rgba(), width)
+        pen = self._pen_cache.get(key)
+        if pen is None:
+            if len(self._pen_cache) >= _STYLE_CACHE_SIZE:
+                self._pen_cache.clear()
+            pen = self._pen_cache[key] = QPen(QColor(color), width)
+        return pen
+
+    def _is_plain_rect(self, item: InteractiveItem[T]) -> bool:
+        """True if the item is drawn as a square-cornered rectangle without glow."""
+        visuals = item.visuals
+        return (visuals.shape == ItemShape.RECTANGLE and self.item_corner_radius <= 0
+                and not (visuals.glow_color and visuals.glow_radius > 0))
+
+    def _item_fill(self, item: InteractiveItem[T]) -> QColor:
+        """Fill color (hierarchy: item > strategy > default)."""
+        fill = item.visuals.fill_color
+        if not fill and self.get_item_color:
+            fill = self.get_item_color(item)
+        if not fill:
+            fill = QColor(100, 150, 200)
+        return fill
+
     def _draw_standard_item(self, p: QPainter, item: InteractiveItem[T], rect: QRectF, highlighted: bool) -> None:
         """Standard item drawing using static visual properties."""
         visuals = item.visuals
@@ -689,11 +795,7 @@ class InteractionHandler(QObject, Generic[T]):
             p.drawEllipse(rect.center(), rect.width() * visuals.glow_radius, rect.height() * visuals.glow_radius)
 
         # Determine fill color (hierarchy: item > strategy > default)
-        fill = visuals.fill_color
-        if not fill and self.get_item_color:
-            fill = self.get_item_color(item)
-        if not fill:
-            fill = QColor(100, 150, 200)
+        fill = self._item_fill(item)
 
         # Cache for ghost rendering
         setattr(item, "_cached_brush_color", fill)
@@ -706,9 +808,9 @@ class InteractionHandler(QObject, Generic[T]):
             stroke = QColor(80, 120, 255)
 
         # Set painter state
-        p.setBrush(QBrush(fill))
+        p.setBrush(self._brush(fill))
         if stroke:
-            p.setPen(QPen(stroke, stroke_width))
+            p.setPen(self._pen(stroke, stroke_width))
         else:
             p.setPen(Qt.PenStyle.NoPen)
 
@@ -724,22 +826,33 @@ class InteractionHandler(QObject, Generic[T]):
             else:
                 p.drawRect(rect)
 
-        # Draw label (hierarchy: item > strategy > none)
+        self._draw_item_label(p, item, rect)
+
+    def _draw_item_label(self, p: QPainter, item: InteractiveItem[T], rect: QRectF) -> None:
+        """Draw the item label (hierarchy: item > strategy > none) if it fits."""
+        visuals = item.visuals
         label = visuals.label
         if not label and self.get_item_label:
             label = self.get_item_label(item)
 
-        if label:
-            label_color = visuals.label_color or Qt.GlobalColor.white
-            p.setPen(QPen(label_color))
-            align = visuals.label_align if visuals.label_align else Qt.AlignmentFlag.AlignCenter
+        if not label:
+            return
+
+        # Only draw if it fits inside the item rect (avoid clutter at scale). When
+        # zoomed out most items are too small for any text, so rule that out
+        # before measuring the string.
+        pad = 4
+        fm = p.fontMetrics()
+        if rect.width() - 2 * pad <= 0 or rect.height() - 2 * pad < fm.height():
+            return
+        text = str(label)
+        if rect.width() - 2 * pad < fm.horizontalAdvance(text):
+            return
 
-            # Only draw if it fits inside the item rect (avoid clutter at scale)
-            fm = p.fontMetrics()
-            text = str(label)
-            pad = 4
-            if (rect.width() - 2 * pad) >= fm.horizontalAdvance(text) and (rect.height() - 2 * pad) >= fm.height():
-                p.drawText(rect.adjusted(pad, pad, -pad, -pad), align, text)
+        label_color = visuals.label_color or _LABEL_COLOR
+        p.setPen(self._pen(label_color, 1))
+        align = visuals.label_align if visuals.label_align else Qt.AlignmentFlag.AlignCenter
+        p.drawText(rect.adjusted(pad, pad, -pad, -pad), align, text)
 
     def _draw_overlay(self, p: QPainter) -> None:
         if not self.xr or not self.yr:
@@ -786,7 +899,7 @@ class InteractionHandler(QObject, Generic[T]):
         x, y = self.xr.get_value_at(pos.x()), self.yr.get_value_at(pos.y())
         self._press_data_coords = (x, y)  # Store data coordinates in native types
 
-        self._press_item = next((i for i in self.items if i.contains(x, y)), None)
+        self._press_item = next((i for i in self._items_in(x, x, y, y) if i.contains(x, y)), None)
 
         if self._press_item:
             if not self._press_item.selected and not (evt.modifiers() & Qt.KeyboardModifier.ControlModifier):
@@ -924,7 +1037,7 @@ class InteractionHandler(QObject, Generic[T]):
                 item.selected = False
 
         # Select items that intersect the band
-        for item in self.items:
+        for item in self._items_in(x1, x2, y1, y2):
             # Quick bounds check
             if (item.x > x2 or
                 item.x + item.width < x1 or
@@ -943,7 +1056,7 @@ class InteractionHandler(QObject, Generic[T]):
         x, y = self.xr.get_value_at(pos.x()), self.yr.get_value_at(pos.y())
 
         # Find item under cursor
-        new_hover_item = next((i for i in self.items if i.contains(x, y)), None)
+        new_hover_item = next((i for i in self._items_in(x, x, y, y) if i.contains(x, y)), None)
 
         # Check for resize handle if hovering over an item
         new_hover_handle = None
@@ -1,4 +1,6 @@
 from typing import Tuple
+import numpy as np
+
 from .base import BaseRuler
 
 
@@ -103,3 +105,7 @@ class ItemRuler(BaseRuler):
         y_start = self.transform(float(item_index))
         y_stop = self.transform(float(item_index + 1))
         return (y_start, y_stop)
+
+    def get_item_edges(self, first: int, stop: int) -> np.ndarray:
+        """Get pixel positions of the edges of items [first, stop) as an array, in one vectorized transform."""
+        return self.transform(np.arange(first, stop + 1, dtype=np.float64))